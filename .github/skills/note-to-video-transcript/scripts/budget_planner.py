@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Plan word budgets for a whole corpus of notes at once.
+
+Section statistics for every document are loaded into padded NumPy
+arrays, and proportional budgets, clamps, exact rounding and duration
+estimates are computed for all documents in batched array operations.
+Single documents keep using build_transcript.allocate_word_budget(),
+which follows the same rules.
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("Error: numpy is not installed.")
+    print("Install it with: pip install numpy")
+    sys.exit(1)
+
+from build_transcript import (
+    BISECTION_STEPS,
+    FIXED_WORDS,
+    FRACTION_DIGITS,
+    MAX_SECTION_BUDGET,
+    MIN_SECTION_BUDGET,
+    WORDS_PER_MINUTE,
+)
+from normalize_notes import load_metadata_sidecar, normalize_notes
+
+
+def load_section_stats(documents: list) -> tuple:
+    """
+    Pack per-section word counts into padded arrays.
+    
+    Args:
+        documents: Metadata dicts with a "sections" list (as written to
+            the normalizer's sidecar or returned by parse_content())
+    
+    Returns:
+        (weights, mask) tuple of (documents x max_sections) arrays;
+        weights are word counts floored at 1, mask marks real sections
+    """
+    counts = [len(doc["sections"]) for doc in documents]
+    width = max(counts, default=0)
+    
+    weights = np.ones((len(documents), width), dtype=np.float64)
+    mask = np.zeros((len(documents), width), dtype=bool)
+    
+    for row, doc in enumerate(documents):
+        words = [section.get("word_count", 1) for section in doc["sections"]]
+        weights[row, :len(words)] = np.maximum(words, 1)
+        mask[row, :len(words)] = True
+    
+    return weights, mask
+
+
+def plan_budgets(
+    weights,
+    mask,
+    target_minutes,
+    min_words: int = MIN_SECTION_BUDGET,
+    max_words: int = MAX_SECTION_BUDGET,
+):
+    """
+    Compute word budgets for every section of every document.
+    
+    Vectorized form of build_transcript.proportional_budgets(): one
+    bisection on a per-document scale runs for all documents together,
+    followed by largest-remainder rounding so each document's budgets sum
+    exactly to its main-section words.
+    
+    Args:
+        weights: (documents x sections) section weights
+        mask: (documents x sections) real-section mask
+        target_minutes: Scalar or per-document array of target durations
+        min_words: Smallest budget per section
+        max_words: Largest budget per section (None for no limit)
+    
+    Returns:
+        (documents x sections) integer array of budgets, 0 where masked
+    """
+    docs = weights.shape[0]
+    counts = mask.sum(axis=1)
+    safe_counts = np.maximum(counts, 1)
+    
+    target_words = np.floor(np.broadcast_to(np.asarray(target_minutes, dtype=np.float64), (docs,)) * WORDS_PER_MINUTE)
+    total = np.maximum(target_words - FIXED_WORDS, 0)
+    
+    high = np.inf if max_words is None else float(max_words)
+    low = np.minimum(np.minimum(min_words, total // safe_counts), high)[:, None]
+    
+    # Padding gets zero weight and zero bounds, so it never contributes
+    weights = np.where(mask, weights, 0.0)
+    low = np.where(mask, low, 0.0)
+    high = np.where(mask, high, 0.0)
+    
+    # Scale bracket: at scale_high every section reaches total (or the cap)
+    min_weight = np.where(mask, weights, np.inf).min(axis=1, initial=np.inf)
+    min_weight = np.where(np.isfinite(min_weight), min_weight, 1.0)
+    ceiling = total if max_words is None else np.maximum(total, max_words)
+    scale_low = np.zeros(docs)
+    scale_high = ceiling / min_weight
+    scaled = np.empty_like(weights)
+    
+    for _ in range(BISECTION_STEPS):
+        scale = (scale_low + scale_high) / 2
+        np.multiply(scale[:, None], weights, out=scaled)
+        np.clip(scaled, low, high, out=scaled)
+        short = scaled.sum(axis=1) < total
+        scale_low = np.where(short, scale, scale_low)
+        scale_high = np.where(short, scale_high, scale)
+    
+    shares = np.clip(scale_high[:, None] * weights, low, high)
+    budgets = np.floor(shares)
+    
+    # Largest remainder: give leftover words to the biggest fractional
+    # parts (rounded so float noise does not reorder equal shares)
+    remainder = (total - budgets.sum(axis=1)).astype(np.int64)
+    fractions = np.where(mask, np.round(shares - budgets, FRACTION_DIGITS), -1.0)
+    order = np.argsort(-fractions, axis=1, kind="stable")
+    ranks = np.argsort(order, axis=1, kind="stable")
+    budgets += (ranks < remainder[:, None]) & mask
+    
+    # Documents that cannot fit under the cap get the cap everywhere
+    if max_words is not None:
+        capped = counts * max_words <= total
+        budgets[capped] = np.where(mask[capped], max_words, 0)
+    
+    return budgets.astype(np.int64)
+
+
+def plan_corpus(
+    documents: list,
+    target_minutes=6.0,
+    min_words: int = MIN_SECTION_BUDGET,
+    max_words: int = MAX_SECTION_BUDGET,
+) -> list:
+    """
+    Plan budgets and duration estimates for many documents.
+    
+    Args:
+        documents: Metadata dicts with "title" and "sections"
+        target_minutes: Scalar or per-document target durations
+        min_words: Smallest budget per section
+        max_words: Largest budget per section (None for no limit)
+    
+    Returns:
+        One plan dict per document with per-section budgets, total words
+        and estimated minutes
+    """
+    if not documents:
+        return []
+    
+    weights, mask = load_section_stats(documents)
+    budgets = plan_budgets(weights, mask, target_minutes, min_words, max_words)
+    
+    main_words = budgets.sum(axis=1)
+    total_words = main_words + FIXED_WORDS
+    minutes = total_words / WORDS_PER_MINUTE
+    
+    plans = []
+    for row, doc in enumerate(documents):
+        count = len(doc["sections"])
+        row_budgets = budgets[row, :count].tolist()
+        plans.append({
+            "title": doc.get("title", "Untitled Video"),
+            "sections": [
+                {"heading": section["heading"], "word_budget": budget}
+                for section, budget in zip(doc["sections"], row_budgets)
+            ],
+            "total_words": int(total_words[row]),
+            "estimated_minutes": round(float(minutes[row]), 2),
+        })
+    
+    return plans
+
+
+def load_document(path: Path) -> dict:
+    """
+    Load section statistics for one file.
+    
+    Normalized files with a fresh sidecar are read from it; anything else
+    is normalized in memory to gather the same metadata.
+    """
+    text = path.read_text(encoding="utf-8")
+    metadata = load_metadata_sidecar(path, text)
+    if metadata is None:
+        metadata = {}
+        normalize_notes(text, metadata)
+    metadata["source"] = str(path)
+    return metadata
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Plan word budgets for a corpus of notes"
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=str,
+        help="Markdown files or directories to plan"
+    )
+    parser.add_argument(
+        "--minutes",
+        type=float,
+        default=6.0,
+        help="Target duration per video in minutes (default: 6.0)"
+    )
+    parser.add_argument(
+        "--min-words",
+        type=int,
+        default=MIN_SECTION_BUDGET,
+        help=f"Smallest budget per section (default: {MIN_SECTION_BUDGET})"
+    )
+    parser.add_argument(
+        "--max-words",
+        type=int,
+        default=MAX_SECTION_BUDGET,
+        help=f"Largest budget per section (default: {MAX_SECTION_BUDGET})"
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=str,
+        help="Optional: write all plans as JSON to this path"
+    )
+    
+    args = parser.parse_args()
+    
+    paths = []
+    for item in args.inputs:
+        path = Path(item)
+        if path.is_dir():
+            paths.extend(sorted(path.glob("*.md")))
+        elif path.exists():
+            paths.append(path)
+        else:
+            print(f"Warning: Skipping missing path: {path}")
+    
+    if not paths:
+        print("Error: No input files found")
+        sys.exit(1)
+    
+    documents = [load_document(path) for path in paths]
+    
+    start = time.perf_counter()
+    plans = plan_corpus(documents, args.minutes, args.min_words, args.max_words)
+    elapsed = time.perf_counter() - start
+    
+    print(f"Planned {len(plans)} documents in {elapsed * 1000:.1f} ms")
+    for doc, plan in zip(documents, plans):
+        print(f"  {Path(doc['source']).name}: {len(plan['sections'])} sections, "
+              f"~{plan['estimated_minutes']:.1f} minutes")
+    
+    if args.output:
+        Path(args.output).write_text(json.dumps(plans, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"\n✓ Plans saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,15 +7,66 @@ video transcript with natural pacing and style.
 """
 
 import argparse
+import hashlib
+import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, nullcontext
 from datetime import datetime
 from pathlib import Path
 
+from dedup_paragraphs import (
+    DEFAULT_THRESHOLD,
+    MODES as DEDUP_MODES,
+    ParagraphIndex,
+    collect_paths,
+    dedup_text,
+    index_references,
+)
+from generation_backends import (
+    DEFAULT_CACHE_SIZE,
+    CachedBackend,
+    GenerationBackend,
+    HttpBackend,
+    ResponseCache,
+)
+from normalize_notes import (
+    count_tokens,
+    count_words,
+    find_code_spans,
+    iter_lines,
+    load_metadata_sidecar,
+    strip_code_spans,
+)
+from transcript_templates import (
+    compile_phrase,
+    list_presets,
+    load_layout,
+    load_preset_config,
+    render_phrase,
+)
+
 
 # Constants
 WORDS_PER_MINUTE = 150  # Average speaking rate
-PRESETS = ["neutral", "xiaohongshu", "professional"]
+CJK_CHARS_PER_MINUTE = 250  # Speaking rate for Chinese/Japanese/Korean
+FIXED_WORDS = 250  # Hook + intro + recap + CTA
+MAX_SECTIONS = 5  # Sections rendered in a single video
+MIN_SECTION_WORDS = 30  # Floor when sizing near-empty sections for a series
+MIN_SECTION_BUDGET = 20  # Smallest word budget for a rendered section
+MAX_SECTION_BUDGET = 400  # Largest word budget for a rendered section
+BISECTION_STEPS = 50  # Scale precision far below one word
+FRACTION_DIGITS = 9  # Rounding of fractional shares before ranking them
+MAX_SENTENCES = 10  # Sentences spoken per section
+REDUCED_SENTENCES = 3  # Sentences per section when short on time
+FINISH_RESERVE = 0.05  # Share of a deadline kept for assembling the output
+DEGRADATIONS = ["fewer_sentences", "skip_outline", "headings_only"]  # Applied in order
+RULES_FALLBACK = "rules_fallback"  # Recorded when a backend runs out of time
+PRESETS = list_presets()
+BACKENDS = ["rules", "http"]
 
 
 def load_style_preset(preset_name: str, resources_dir: Path) -> dict:
@@ -35,95 +86,192 @@ def load_style_preset(preset_name: str, resources_dir: Path) -> dict:
         print(f"Warning: Preset file not found: {preset_path}")
         print(f"Using default neutral style")
         preset_name = "neutral"
+        preset_path = resources_dir / "style-presets" / "neutral.md"
     
-    # Return style configuration based on preset
-    if preset_name == "neutral":
-        return {
-            "name": "neutral",
-            "sentence_length": (12, 18),
-            "use_contractions": False,
-            "use_emoji": False,
-            "formality": "balanced",
-            "pronouns": ["you", "we"],
-        }
-    elif preset_name == "xiaohongshu":
-        return {
-            "name": "xiaohongshu",
-            "sentence_length": (8, 12),
-            "use_contractions": True,
-            "use_emoji": True,
-            "formality": "casual",
-            "pronouns": ["I", "you", "we"],
-        }
-    elif preset_name == "professional":
-        return {
-            "name": "professional",
-            "sentence_length": (15, 20),
-            "use_contractions": False,
-            "use_emoji": False,
-            "formality": "formal",
-            "pronouns": ["we", "you"],
-        }
-    else:
-        return load_style_preset("neutral", resources_dir)
+    # Settings and phrases come from the preset file's JSON block
+    try:
+        return {"name": preset_name, **load_preset_config(preset_path)}
+    except ValueError as e:
+        if preset_name == "neutral":
+            raise
+        print(f"Warning: Invalid preset file: {e}")
+        print(f"Using default neutral style")
+    
+    return {"name": "neutral", **load_preset_config(resources_dir / "style-presets" / "neutral.md")}
+
+
+def _finish_section(section: dict, content_buffer: list, buffer_spans: list) -> dict:
+    """Attach stripped content, rebased code spans and word count to a section."""
+    raw = "\n".join(content_buffer)
+    content = raw.strip()
+    lead = len(raw) - len(raw.lstrip())
+    
+    spans = []
+    for start, end, language, _ in buffer_spans:
+        start = max(start - lead, 0)
+        end = min(end - lead, len(content))
+        if start < end:
+            spans.append((start, end, language))
+    
+    section["content"] = content
+    section["code_spans"] = spans
+    section["word_count"] = count_words(content, spans)
+    section["content_hash"] = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    return section
 
 
 def parse_content(text: str) -> dict:
     """
     Parse normalized Markdown into sections.
     
+    Fenced code is indexed once up front; each section carries its own
+    slice of that index (offsets relative to the section content) so
+    rendering and word counting never rescan for fences.
+    
+    Each section also gets a stable section_id derived from its heading
+    path (so it survives edits to its content) and a content_hash.
+    
     Returns:
         Dict with title, sections list, metadata
     """
-    lines = text.split("\n")
+    code_spans = find_code_spans(text)
     sections = []
     current_section = None
     content_buffer = []
+    buffer_spans = []
+    buffer_len = 0
+    path = []
+    seen_paths = {}
     
     # Extract title (first H1)
     title = None
     
-    for line in lines:
-        # Check for headings
-        heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
+    for _, line, span in iter_lines(text, code_spans):
+        # Check for headings (never inside fenced code)
+        heading_match = None
+        if span is None:
+            heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
         
         if heading_match:
             # Save previous section
             if current_section:
-                current_section["content"] = "\n".join(content_buffer).strip()
-                sections.append(current_section)
+                sections.append(_finish_section(current_section, content_buffer, buffer_spans))
                 content_buffer = []
+                buffer_spans = []
+                buffer_len = 0
             
             # Start new section
             level = len(heading_match.group(1))
             heading_text = heading_match.group(2).strip()
             
+            while path and path[-1][0] >= level:
+                path.pop()
+            path.append((level, heading_text))
+            
             if level == 1 and not title:
                 title = heading_text
+                current_section = None
                 continue
             
+            # Repeated heading paths are told apart by occurrence
+            identity = "\n".join(text for _, text in path)
+            seen_paths[identity] = seen_paths.get(identity, 0) + 1
+            identity += f"\n#{seen_paths[identity]}"
+            
             current_section = {
                 "level": level,
                 "heading": heading_text,
+                "path": [text for _, text in path],
+                "section_id": hashlib.sha256(identity.encode("utf-8")).hexdigest()[:16],
                 "content": ""
             }
         else:
             # Accumulate content
             if current_section or title:
+                line_start = buffer_len + (1 if content_buffer else 0)
+                if span is not None:
+                    if buffer_spans and buffer_spans[-1][3] == span:
+                        buffer_spans[-1][1] = line_start + len(line)
+                    else:
+                        buffer_spans.append([line_start, line_start + len(line), span[2], span])
                 content_buffer.append(line)
+                buffer_len = line_start + len(line)
     
     # Save last section
     if current_section:
-        current_section["content"] = "\n".join(content_buffer).strip()
-        sections.append(current_section)
+        sections.append(_finish_section(current_section, content_buffer, buffer_spans))
     
     return {
         "title": title or "Untitled Video",
-        "sections": sections
+        "sections": sections,
+        "code_spans": code_spans
     }
 
 
-def allocate_word_budget(sections: list, target_words: int) -> list:
+def proportional_budgets(
+    weights: list,
+    total: int,
+    min_words: int = MIN_SECTION_BUDGET,
+    max_words: int = MAX_SECTION_BUDGET,
+) -> list:
+    """
+    Split total words in proportion to weights, within clamps.
+    
+    Finds the scale at which the clamped shares sum to total (bisection),
+    then rounds with the largest-remainder method so the integer budgets
+    add up to total exactly. When the clamps cannot be met, the minimum
+    is lowered to an equal share, or every section gets the maximum.
+    
+    Args:
+        weights: Positive section weights (e.g. source word counts)
+        total: Words to distribute
+        min_words: Smallest budget per section
+        max_words: Largest budget per section (None for no limit)
+    
+    Returns:
+        List of integer budgets aligned with weights
+    """
+    count = len(weights)
+    if count == 0:
+        return []
+    
+    total = max(total, 0)
+    high = float("inf") if max_words is None else max_words
+    low = min(min_words, total // count, high)
+    if count * high <= total:
+        return [int(high)] * count
+    
+    def filled(scale):
+        return sum(min(max(scale * w, low), high) for w in weights)
+    
+    scale_low = 0.0
+    scale_high = total / min(weights) if high == float("inf") else max(total, high) / min(weights)
+    for _ in range(BISECTION_STEPS):
+        scale = (scale_low + scale_high) / 2
+        if filled(scale) < total:
+            scale_low = scale
+        else:
+            scale_high = scale
+    
+    shares = [min(max(scale_high * w, low), high) for w in weights]
+    budgets = [int(share) for share in shares]
+    
+    # Hand leftover words to the largest fractional parts (rounded so
+    # float noise does not reorder equal shares)
+    remainder = total - sum(budgets)
+    order = sorted(range(count), key=lambda i: (round(budgets[i] - shares[i], FRACTION_DIGITS), i))
+    for i in order[:max(remainder, 0)]:
+        budgets[i] += 1
+    
+    return budgets
+
+
+def allocate_word_budget(
+    sections: list,
+    target_words: int,
+    min_words: int = MIN_SECTION_BUDGET,
+    max_words: int = MAX_SECTION_BUDGET,
+) -> list:
     """
     Allocate word budget across sections.
     
@@ -134,59 +282,47 @@ def allocate_word_budget(sections: list, target_words: int) -> list:
     - CTA: ~30 words
     - Total fixed: ~250 words
     
-    Remaining words distributed across main sections.
+    Remaining words are distributed in proportion to each section's
+    source word count, clamped to [min_words, max_words], with budgets
+    summing exactly to the remaining words (see proportional_budgets()).
+    Sections without a word_count are weighted equally.
     """
-    fixed_words = 250
-    main_section_words = target_words - fixed_words
+    main_section_words = target_words - FIXED_WORDS
     
     if main_section_words < 100:
         print(f"Warning: Target duration too short for quality output")
     
-    # Distribute across sections (simple equal distribution for now)
-    section_count = len(sections)
-    if section_count == 0:
-        words_per_section = 0
-    else:
-        words_per_section = main_section_words // section_count
+    weights = [max(section.get("word_count", 1), 1) for section in sections]
+    budgets = proportional_budgets(weights, main_section_words, min_words, max_words)
     
     allocated = []
-    for section in sections:
+    for section, budget in zip(sections, budgets):
         allocated.append({
             **section,
-            "word_budget": words_per_section
+            "word_budget": budget
         })
     
     return allocated
 
 
-def generate_hook(title: str, style: dict) -> str:
+def generate_hook(title: str, style: dict, sections: list = ()) -> str:
     """Generate attention-grabbing hook."""
-    if style["formality"] == "casual":
-        return f"Want to learn about {title.lower()}? Let me show you how! ✨"
-    elif style["formality"] == "formal":
-        return f"Today we will explore {title.lower()} and its practical applications."
-    else:
-        return f"In the next few minutes, you'll learn everything about {title.lower()}."
+    topics = ", ".join([s["heading"] for s in sections[:3]])
+    
+    return render_phrase(
+        style["phrases"]["hook"],
+        {"title": title, "title_lower": title.lower(), "topics": topics},
+    )
 
 
 def generate_intro(title: str, sections: list, style: dict) -> str:
     """Generate introduction section."""
     topics = ", ".join([s["heading"] for s in sections[:3]])
     
-    if style["formality"] == "casual":
-        intro = f"Hey everyone! Today we're diving into {title.lower()}. "
-        intro += f"We'll cover {topics}, and more. "
-        intro += f"By the end, you'll totally understand how this works. Let's get started!"
-    elif style["formality"] == "formal":
-        intro = f"This tutorial examines {title.lower()}. "
-        intro += f"We will cover {topics}. "
-        intro += f"The concepts presented will provide you with a comprehensive understanding of the topic."
-    else:
-        intro = f"Welcome! Today we're exploring {title.lower()}. "
-        intro += f"We'll look at {topics}. "
-        intro += f"By the end, you'll have a clear understanding of how everything fits together."
-    
-    return intro
+    return render_phrase(
+        style["phrases"]["intro"],
+        {"title": title, "title_lower": title.lower(), "topics": topics},
+    )
 
 
 def generate_section_content(section: dict, style: dict) -> str:
@@ -194,12 +330,17 @@ def generate_section_content(section: dict, style: dict) -> str:
     Generate spoken content for a section.
     
     This is a simplified version - in a full implementation,
-    this would use LLM or more sophisticated NLP.
+    this would use LLM or more sophisticated NLP. A "max_sentences" field
+    in the request caps the sentences spoken (default: MAX_SENTENCES).
     """
+    limit = section.get("max_sentences", MAX_SENTENCES)
     content = section["content"]
+    code_spans = section.get("code_spans")
+    if code_spans is None:
+        code_spans = find_code_spans(content)
     
     # Remove markdown artifacts
-    content = re.sub(r"```[\s\S]*?```", "[code example]", content)
+    content = strip_code_spans(content, code_spans, "[code example]")
     content = re.sub(r"`([^`]+)`", r"\1", content)
     content = re.sub(r"\*\*([^*]+)\*\*", r"\1", content)
     content = re.sub(r"\*([^*]+)\*", r"\1", content)
@@ -211,7 +352,7 @@ def generate_section_content(section: dict, style: dict) -> str:
     # Apply contractions if needed
     if style["use_contractions"]:
         spoken_sentences = []
-        for sent in sentences[:10]:  # Limit for demo
+        for sent in sentences[:limit]:
             sent = re.sub(r"\bis not\b", "isn't", sent, flags=re.IGNORECASE)
             sent = re.sub(r"\bare not\b", "aren't", sent, flags=re.IGNORECASE)
             sent = re.sub(r"\bdo not\b", "don't", sent, flags=re.IGNORECASE)
@@ -220,115 +361,733 @@ def generate_section_content(section: dict, style: dict) -> str:
             sent = re.sub(r"\bwould not\b", "wouldn't", sent, flags=re.IGNORECASE)
             spoken_sentences.append(sent)
     else:
-        spoken_sentences = sentences[:10]
+        spoken_sentences = sentences[:limit]
     
     result = ". ".join(spoken_sentences)
     if not result.endswith("."):
         result += "."
     
     # Add transition
-    if style["formality"] == "casual":
-        result = "So, here's the thing. " + result
-    elif style["formality"] == "formal":
-        result = "Let us examine this concept. " + result
-    else:
-        result = "Here's what you need to know. " + result
-    
-    return result
+    return render_phrase(style["phrases"]["section"], {"heading": section["heading"], "body": result})
 
 
-def generate_recap(sections: list, style: dict) -> str:
-    """Generate recap section."""
-    if style["formality"] == "casual":
-        recap = "OK, let's recap what we covered:\n\n"
-    elif style["formality"] == "formal":
-        recap = "To summarize the key points:\n\n"
-    else:
-        recap = "Let's quickly recap:\n\n"
-    
-    for section in sections[:5]:
-        recap += f"- **{section['heading']}**: Key concepts and applications\n"
+def generate_recap(sections: list, style: dict, limit: int = MAX_SECTIONS) -> str:
+    """Generate recap section covering the first limit sections (None for all)."""
+    render_item = compile_phrase(style["phrases"]["recap_item"])
+    items = "".join([render_item({"heading": section["heading"]}) for section in sections[:limit]])
     
-    return recap
+    return render_phrase(style["phrases"]["recap"], {"items": items})
 
 
 def generate_cta(style: dict) -> str:
     """Generate call to action."""
-    if style["formality"] == "casual":
-        return "If this helped you, smash that like button! Drop your questions below. See you next time! ✨"
-    elif style["formality"] == "formal":
-        return "If you found this content valuable, please consider subscribing. Thank you for your attention."
+    return render_phrase(style["phrases"]["cta"], {})
+
+
+class RuleBasedBackend(GenerationBackend):
+    """Default backend built on the rule-based generate_* functions."""
+    
+    name = "rules"
+    uses_word_budget = False
+    
+    def __init__(self):
+        # CPU-bound and cheap: threads would only add overhead
+        super().__init__(max_workers=1)
+    
+    def generate(self, request: dict, style: dict) -> str:
+        kind = request["kind"]
+        if kind == "hook":
+            sections = [{"heading": heading} for heading in request["headings"]]
+            return generate_hook(request["title"], style, sections)
+        if kind == "intro":
+            sections = [{"heading": heading} for heading in request["headings"]]
+            return generate_intro(request["title"], sections, style)
+        if kind == "section":
+            return generate_section_content(request, style)
+        if kind == "recap":
+            sections = [{"heading": heading} for heading in request["headings"]]
+            return generate_recap(sections, style, limit=None)
+        if kind == "cta":
+            return generate_cta(style)
+        raise ValueError(f"Unknown request kind: {kind}")
+
+
+def create_backend(
+    name: str = "rules",
+    url: str = None,
+    cache_dir: str = None,
+    cache_size: int = None,
+) -> GenerationBackend:
+    """
+    Create a generation backend, optionally wrapped in a disk cache.
+    
+    Args:
+        name: Backend name (rules, http)
+        url: Server URL for the http backend
+        cache_dir: Directory for the response cache (None disables it)
+        cache_size: Maximum cached responses
+    
+    Returns:
+        Configured backend
+    """
+    if name == "http":
+        if not url:
+            raise ValueError("The http backend needs a server URL")
+        backend = HttpBackend(url)
+    elif name == "rules":
+        backend = RuleBasedBackend()
     else:
-        return "If you found this helpful, give it a like and subscribe for more. Thanks for watching!"
+        raise ValueError(f"Unknown backend: {name}")
+    
+    if cache_dir:
+        cache = ResponseCache(Path(cache_dir), cache_size or DEFAULT_CACHE_SIZE)
+        backend = CachedBackend(backend, cache)
+    
+    return backend
+
+
+def format_duration(seconds: float) -> str:
+    """Format an estimated duration the way transcript labels show it."""
+    if seconds < 60:
+        return f"{round(seconds)} seconds"
+    return f"{seconds / 60:.1f} minutes"
 
 
-def build_transcript(content_dict: dict, target_minutes: float, style: dict) -> str:
+def _render_key(request: dict, version: str, preset: str, backend: GenerationBackend) -> str:
     """
-    Build complete transcript.
+    Hash what a rendered block depends on, for the render cache.
+    
+    Sections are keyed by their content_hash (version) and sentence cap,
+    plus the word budget only for backends that use it: budgets are
+    proportional, so editing one section shifts every section's budget.
+    Other blocks are small and keyed by their whole request.
+    """
+    if version is None:
+        return ResponseCache.key(request, preset, backend.cache_id)
+    
+    material = {"kind": request["kind"], "content_hash": version}
+    if "max_sentences" in request:
+        material["max_sentences"] = request["max_sentences"]
+    if backend.uses_word_budget:
+        material["word_budget"] = request["word_budget"]
+    return ResponseCache.key(material, preset, backend.cache_id)
+
+
+def _generate_with_render_cache(
+    requests: list,
+    identities: list,
+    versions: list,
+    style: dict,
+    backend: GenerationBackend,
+    render_cache: dict = None,
+    timeout: float = None,
+) -> tuple:
+    """
+    Generate text for requests, reusing unchanged blocks from render_cache.
+    
+    A cached block is reused when the block with the same identity (block
+    kind or section_id) has the same render key as last time (see
+    _render_key()): for a section, an unchanged content_hash, preset
+    (including its phrases) and backend cache_id.
     
     Args:
-        content_dict: Parsed content with title and sections
+        requests: Generation requests
+        identities: Render cache identity of each request
+        versions: content_hash of each section request, None for the
+            other blocks
+        style: Style preset configuration
+        backend: Generation backend
+        render_cache: Optional cache from load_render_cache()
+        timeout: Optional seconds a remote backend may take
+    
+    Returns:
+        (texts, reused, hashes) tuple of lists aligned with requests
+    """
+    texts = [None] * len(requests)
+    preset = ResponseCache.preset_key(style)
+    hashes = [
+        _render_key(request, version, preset, backend)
+        for request, version in zip(requests, versions)
+    ]
+    
+    if render_cache is not None:
+        for i, (identity, request_hash) in enumerate(zip(identities, hashes)):
+            entry = render_cache.get(identity)
+            if entry and entry.get("hash") == request_hash:
+                texts[i] = entry["text"]
+    
+    reused = [text is not None for text in texts]
+    missing = [i for i, text in enumerate(texts) if text is None]
+    if missing:
+        generated = backend.generate_batch([requests[i] for i in missing], style, timeout)
+        for i, text in zip(missing, generated):
+            texts[i] = text
+    
+    return texts, reused, hashes
+
+
+def _store_render_cache(render_cache: dict, identities: list, hashes: list, texts: list):
+    """Replace render_cache with the blocks of the current build."""
+    # Keep only blocks of the current build so removed sections drop out
+    render_cache.clear()
+    for identity, request_hash, text in zip(identities, hashes, texts):
+        if text is not None:
+            render_cache[identity] = {"hash": request_hash, "text": text}
+
+
+def render_cache_path(cache_dir: Path, document: Path) -> Path:
+    """Return the render cache file for a document."""
+    key = hashlib.sha256(str(document.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{key}.json"
+
+
+def load_render_cache(cache_dir: Path, document: Path) -> dict:
+    """
+    Load the per-document cache of rendered blocks.
+    
+    Returns:
+        Dict mapping block identity to its request hash and text; empty if
+        nothing was cached yet
+    """
+    path = render_cache_path(cache_dir, document)
+    if not path.exists():
+        return {}
+    
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_render_cache(cache_dir: Path, document: Path, render_cache: dict) -> Path:
+    """Write the per-document cache of rendered blocks."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = render_cache_path(cache_dir, document)
+    path.write_text(json.dumps(render_cache, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+class Deadline:
+    """
+    Time budget for one transcript build.
+    
+    Records how long each stage takes and which degradations (see
+    DEGRADATIONS and RULES_FALLBACK) were applied to finish on time. A
+    fraction of the budget (FINISH_RESERVE) is held back for assembling
+    and writing the output, plus the planning time again while an outline
+    is still due.
+    """
+    
+    def __init__(self, budget_ms: float, outline: bool = False):
+        if budget_ms <= 0:
+            raise ValueError(f"Deadline must be positive, got {budget_ms} ms")
+        self.budget_ms = budget_ms
+        self.outline = outline
+        self.start = time.perf_counter()
+        self.stages = {}
+        self.degradations = []
+    
+    def elapsed(self) -> float:
+        """Seconds since the build started."""
+        return time.perf_counter() - self.start
+    
+    def available(self) -> float:
+        """Seconds left for generation after the finishing reserve."""
+        reserve = self.budget_ms / 1000 * FINISH_RESERVE
+        if self.outline:
+            reserve += self.stages.get("plan", 0.0)
+        return self.budget_ms / 1000 - self.elapsed() - reserve
+    
+    @contextmanager
+    def stage(self, name: str):
+        """Time a stage; repeated stages accumulate."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+    
+    def degrade(self, name: str):
+        """Record a degradation; skip_outline also cancels the outline."""
+        if name not in self.degradations:
+            self.degradations.append(name)
+        if name == "skip_outline":
+            self.outline = False
+    
+    def report(self) -> dict:
+        """Summarize timings and degradations for the build summary."""
+        elapsed_ms = self.elapsed() * 1000
+        return {
+            "deadline_ms": self.budget_ms,
+            "elapsed_ms": round(elapsed_ms, 1),
+            "met": elapsed_ms <= self.budget_ms,
+            "stages": {name: round(seconds * 1000, 2) for name, seconds in self.stages.items()},
+            "degradations": list(self.degradations),
+        }
+
+
+def _stage(deadline: Deadline, name: str):
+    """Time a stage against deadline, or do nothing without one."""
+    return deadline.stage(name) if deadline else nullcontext()
+
+
+def _generate_within_deadline(
+    requests: list,
+    identities: list,
+    versions: list,
+    style: dict,
+    backend: GenerationBackend,
+    render_cache: dict,
+    deadline: Deadline,
+) -> tuple:
+    """
+    Generate blocks in waves, degrading section detail to meet a deadline.
+    
+    The hook, intro, recap and CTA (the first four requests) are always
+    produced so the transcript stays complete: if the backend cannot
+    return them in the time left, they come from the rule-based generator
+    instead (RULES_FALLBACK). Sections follow in waves of
+    backend.max_workers. Before each wave, the projected cost of the
+    remaining sections is compared with the time available, and
+    DEGRADATIONS are applied in order: fewer sentences per section, then
+    skipping the outline, then leaving the remaining sections as headings
+    only once not even a reduced wave fits. Every backend call is bounded
+    by the time left; a wave that times out leaves the remaining sections
+    as headings only.
+    
+    Returns:
+        (texts, reused, hashes) lists aligned with requests; text and hash
+        are None for sections left as headings only
+    """
+    started = time.perf_counter()
+    texts = None
+    if backend.name == RuleBasedBackend.name or deadline.available() > 0:
+        try:
+            texts, reused, hashes = _generate_with_render_cache(
+                requests[:4], identities[:4], versions[:4], style, backend, render_cache, deadline.available()
+            )
+        except OSError:
+            # Timed out (or unreachable); fall through to local text
+            pass
+    if texts is None:
+        deadline.degrade(RULES_FALLBACK)
+        texts, reused, hashes = _generate_with_render_cache(
+            requests[:4], identities[:4], versions[:4], style, RuleBasedBackend(), render_cache
+        )
+    first_wave = time.perf_counter() - started
+    
+    sections = requests[4:]
+    wave_size = max(1, backend.max_workers)
+    costs = {"full": [], "reduced": []}
+    mode = "full"
+    done = 0
+    
+    while done < len(sections):
+        waves = -(-(len(sections) - done) // wave_size)
+        full_cost = sum(costs["full"]) / len(costs["full"]) if costs["full"] else first_wave
+        reduced_cost = (
+            sum(costs["reduced"]) / len(costs["reduced"]) if costs["reduced"]
+            else full_cost * REDUCED_SENTENCES / MAX_SENTENCES
+        )
+        
+        if mode == "full" and waves * full_cost > deadline.available():
+            mode = "reduced"
+            deadline.degrade("fewer_sentences")
+        if mode == "reduced" and waves * reduced_cost > deadline.available() and deadline.outline:
+            deadline.degrade("skip_outline")
+        if mode == "reduced" and reduced_cost > deadline.available():
+            deadline.degrade("headings_only")
+            break
+        
+        batch = sections[done:done + wave_size]
+        if mode == "reduced":
+            batch = [{**request, "max_sentences": REDUCED_SENTENCES} for request in batch]
+        
+        started = time.perf_counter()
+        wave = slice(4 + done, 4 + done + len(batch))
+        try:
+            batch_texts, batch_reused, batch_hashes = _generate_with_render_cache(
+                batch, identities[wave], versions[wave], style, backend, render_cache, deadline.available()
+            )
+        except OSError:
+            deadline.degrade("headings_only")
+            break
+        costs[mode].append(time.perf_counter() - started)
+        
+        texts += batch_texts
+        reused += batch_reused
+        hashes += batch_hashes
+        done += len(batch)
+    
+    skipped = len(sections) - done
+    return texts + [None] * skipped, reused + [False] * skipped, hashes + [None] * skipped
+
+
+def _emit_block(parts: list, blocks: list, layout: dict, kind: str, heading: str, text: str, budget: int = None):
+    """Append a spoken block to parts and record its length in blocks."""
+    words, cjk_chars = count_tokens(text)
+    seconds = words / WORDS_PER_MINUTE * 60 + cjk_chars / CJK_CHARS_PER_MINUTE * 60
+    block = {"kind": kind, "heading": heading, "words": words + cjk_chars, "seconds": round(seconds, 1)}
+    
+    label = f"~{block['words']} words"
+    if budget is not None:
+        block["word_budget"] = budget
+        label += f" of {budget} budgeted"
+    blocks.append(block)
+    
+    parts.append(layout["block"]({
+        "heading": heading,
+        "text": text,
+        "duration": format_duration(seconds),
+        "label": label,
+    }))
+
+
+def render_transcript(
+    content_dict: dict,
+    target_minutes: float,
+    style: dict,
+    max_sections: int = MAX_SECTIONS,
+    backend: GenerationBackend = None,
+    render_cache: dict = None,
+    deadline: Deadline = None,
+) -> tuple:
+    """
+    Render a transcript and account for its length as it is emitted.
+    
+    All generated text is requested from the backend in one batch so
+    remote backends can run section requests concurrently. Each spoken
+    block is counted once, when it is appended, so duration labels and
+    the summary reflect the text actually produced.
+    
+    With a deadline, sections are generated in waves and degraded as
+    needed to finish on time (see _generate_within_deadline()); applied
+    degradations are noted in the transcript and the summary.
+    
+    Args:
+        content_dict: Parsed content with title and sections, plus an
+            optional "part" label shown after the title in the header only
         target_minutes: Target video duration in minutes
         style: Style preset configuration
+        max_sections: Sections to render and recap (None for all)
+        backend: Generation backend (default: RuleBasedBackend)
+        render_cache: Optional per-document dict of previously rendered
+            blocks (see load_render_cache()); unchanged blocks are reused
+            and the dict is updated in place
+        deadline: Optional Deadline for this build
     
     Returns:
-        Complete transcript as Markdown string
+        (transcript, summary) tuple; summary holds per-block and total
+        word counts and estimated durations
     """
     title = content_dict["title"]
     sections = content_dict["sections"]
+    backend = backend or RuleBasedBackend()
+    
+    # The part label is for readers; spoken text uses the plain title
+    header_title = f"{title} ({content_dict['part']})" if content_dict.get("part") else title
     
     target_words = int(target_minutes * WORDS_PER_MINUTE)
-    allocated_sections = allocate_word_budget(sections, target_words)
-    
-    # Build transcript
-    transcript = f"# {title}\n\n"
-    transcript += f"> **Target Duration**: {target_minutes} minutes (~{target_words} words)  \n"
-    transcript += f"> **Style Preset**: {style['name']}  \n"
-    transcript += f"> **Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n\n"
-    transcript += "---\n\n"
-    
-    # Hook
-    transcript += "## Hook (10-20 seconds)\n\n"
-    transcript += generate_hook(title, style) + "\n\n"
-    transcript += "**Estimated Duration**: 15 seconds (~40 words)\n\n"
-    transcript += "---\n\n"
-    
-    # Intro
-    transcript += "## Intro\n\n"
-    transcript += generate_intro(title, sections, style) + "\n\n"
-    transcript += "**Estimated Duration**: 45 seconds (~100 words)\n\n"
-    transcript += "---\n\n"
-    
-    # Main sections
-    for i, section in enumerate(allocated_sections[:5], 1):
-        transcript += f"## Section {i}: {section['heading']}\n\n"
-        transcript += generate_section_content(section, style) + "\n\n"
-        minutes = section['word_budget'] / WORDS_PER_MINUTE
-        transcript += f"**Estimated Duration**: {minutes:.1f} minutes (~{section['word_budget']} words)\n\n"
-        transcript += "---\n\n"
-    
-    # Recap
-    transcript += "## Recap\n\n"
-    transcript += generate_recap(sections, style) + "\n\n"
-    transcript += "**Estimated Duration**: 30 seconds (~80 words)\n\n"
-    transcript += "---\n\n"
-    
-    # CTA
-    transcript += "## Call to Action\n\n"
-    transcript += generate_cta(style) + "\n\n"
-    transcript += "**Estimated Duration**: 15 seconds (~30 words)\n\n"
-    transcript += "---\n\n"
+    with _stage(deadline, "plan"):
+        allocated_sections = allocate_word_budget(sections, target_words)
+    rendered_sections = allocated_sections[:max_sections]
+    
+    requests = [
+        {"kind": "hook", "title": title, "headings": [s["heading"] for s in sections[:3]]},
+        {"kind": "intro", "title": title, "headings": [s["heading"] for s in sections[:3]]},
+        {"kind": "recap", "headings": [s["heading"] for s in sections[:max_sections]]},
+        {"kind": "cta"},
+    ]
+    for section in rendered_sections:
+        requests.append({
+            "kind": "section",
+            "heading": section["heading"],
+            "content": section["content"],
+            "code_spans": section.get("code_spans"),
+            "word_budget": section["word_budget"],
+        })
+    identities = ["hook", "intro", "recap", "cta"] + [
+        section.get("section_id", f"section-{i}") for i, section in enumerate(rendered_sections)
+    ]
+    versions = [None] * 4 + [
+        section.get("content_hash") or hashlib.sha256(section["content"].encode("utf-8")).hexdigest()[:16]
+        for section in rendered_sections
+    ]
+    with _stage(deadline, "generate"):
+        if deadline is None:
+            texts, reused, hashes = _generate_with_render_cache(
+                requests, identities, versions, style, backend, render_cache
+            )
+        else:
+            texts, reused, hashes = _generate_within_deadline(
+                requests, identities, versions, style, backend, render_cache, deadline
+            )
+    if render_cache is not None:
+        _store_render_cache(render_cache, identities, hashes, texts)
+    hook, intro, recap, cta, *section_texts = texts
+    
+    layout = load_layout()
+    parts = []
+    blocks = []
+    
+    # Header
+    parts.append(layout["header"]({
+        "title": header_title,
+        "target_minutes": target_minutes,
+        "target_words": target_words,
+        "preset": style["name"],
+        "generated": datetime.now().strftime("%Y-%m-%d %H:%M"),
+    }))
+    
+    _emit_block(parts, blocks, layout, "hook", "Hook (10-20 seconds)", hook)
+    _emit_block(parts, blocks, layout, "intro", "Intro", intro)
+    for i, (section, text) in enumerate(zip(rendered_sections, section_texts), 1):
+        if text is None:
+            # Left as heading only to meet the deadline
+            text = f"{section['heading']}."
+        _emit_block(parts, blocks, layout, "section", f"Section {i}: {section['heading']}", text, section["word_budget"])
+    _emit_block(parts, blocks, layout, "recap", "Recap", recap)
+    _emit_block(parts, blocks, layout, "cta", "Call to Action", cta)
+    
+    total_words = sum(block["words"] for block in blocks)
+    total_seconds = sum(block["seconds"] for block in blocks)
     
     # Production notes
-    transcript += "## Production Notes\n\n"
-    transcript += f"**Total Estimated Duration**: {target_minutes} minutes ({target_words} words)\n\n"
-    transcript += "**Coverage Check**:\n"
+    parts.append(layout["notes"]({"total_minutes": total_seconds / 60, "total_words": total_words}))
+    coverage_item = layout["coverage_item"]
     for section in sections:
-        transcript += f"- ✅ {section['heading']}\n"
+        parts.append(coverage_item({"heading": section["heading"]}))
+    if deadline is not None and deadline.degradations:
+        parts.append(layout["degradations"]({
+            "deadline_ms": deadline.budget_ms,
+            "degradations": ", ".join(deadline.degradations),
+        }))
+    
+    summary = {
+        "title": header_title,
+        "preset": style["name"],
+        "target_minutes": target_minutes,
+        "target_words": target_words,
+        "blocks": blocks,
+        "total_words": total_words,
+        "total_seconds": round(total_seconds, 1),
+        "total_minutes": round(total_seconds / 60, 2),
+        "sections_reused": sum(reused[4:]),
+        "sections_rendered": sum(text is not None for text in section_texts) - sum(reused[4:]),
+    }
+    if deadline is not None:
+        summary["deadline"] = deadline.report()
+    
+    return "".join(parts), summary
+
+
+def build_transcript(
+    content_dict: dict,
+    target_minutes: float,
+    style: dict,
+    max_sections: int = MAX_SECTIONS,
+    backend: GenerationBackend = None,
+    deadline_ms: float = None,
+) -> str:
+    """
+    Build complete transcript.
+    
+    Args:
+        content_dict: Parsed content with title and sections
+        target_minutes: Target video duration in minutes
+        style: Style preset configuration
+        max_sections: Sections to render and recap (None for all)
+        backend: Generation backend (default: RuleBasedBackend)
+        deadline_ms: Optional time budget; detail is reduced as needed
+            to finish within it
     
+    Returns:
+        Complete transcript as Markdown string
+    
+    Raises:
+        ValueError: If deadline_ms is not positive
+    """
+    deadline = Deadline(deadline_ms) if deadline_ms is not None else None
+    transcript, _ = render_transcript(
+        content_dict, target_minutes, style, max_sections, backend, deadline=deadline
+    )
     return transcript
 
 
+def summary_path(transcript_path: Path) -> Path:
+    """Return the machine-readable summary path for a transcript."""
+    return transcript_path.with_suffix(".summary.json")
+
+
+def write_summary(transcript_path: Path, summary: dict) -> Path:
+    """
+    Write a transcript's summary as JSON next to it.
+    
+    The summary records a hash of the written transcript so readers can
+    tell when it no longer matches (see tests/test_golden_output.py).
+    """
+    path = summary_path(transcript_path)
+    payload = {
+        "sha256": hashlib.sha256(transcript_path.read_text(encoding="utf-8").encode("utf-8")).hexdigest(),
+        **summary,
+    }
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def partition_sections(sections: list, minutes_per_episode: float) -> list:
+    """
+    Split a document's sections into episode-sized parts.
+    
+    Sections are grouped under their top-level heading and groups are
+    packed in order until an episode's word budget is full. A group that
+    does not fit in one episode on its own is split between its
+    subsections.
+    
+    Args:
+        sections: Parsed sections (with word_count) in document order
+        minutes_per_episode: Target duration of each episode
+    
+    Returns:
+        List of parts, each a non-empty list of sections
+    """
+    if not sections:
+        return []
+    
+    budget = max(int(minutes_per_episode * WORDS_PER_MINUTE) - FIXED_WORDS, MIN_SECTION_WORDS)
+    top_level = min(section["level"] for section in sections)
+    
+    # Group each top-level section with the subsections that follow it
+    groups = []
+    for section in sections:
+        if section["level"] == top_level or not groups:
+            groups.append([])
+        groups[-1].append(section)
+    
+    parts = []
+    current = []
+    current_words = 0
+    
+    for group in groups:
+        sizes = [max(s.get("word_count", 0), MIN_SECTION_WORDS) for s in group]
+        group_words = sum(sizes)
+        
+        if group_words > budget:
+            # Oversized group: pack its sections individually
+            units = [([s], size) for s, size in zip(group, sizes)]
+        else:
+            units = [(group, group_words)]
+        
+        for unit, words in units:
+            if current and current_words + words > budget:
+                parts.append(current)
+                current = []
+                current_words = 0
+            current.extend(unit)
+            current_words += words
+    
+    if current:
+        parts.append(current)
+    
+    return parts
+
+
+def _render_part(job: tuple) -> tuple:
+    """Render one series part (runs in a worker process)."""
+    content_dict, target_minutes, style, backend = job
+    return render_transcript(content_dict, target_minutes, style, max_sections=None, backend=backend)
+
+
+def build_series(
+    content_dict: dict,
+    minutes_per_episode: float,
+    style: dict,
+    output_dir: Path,
+    workers: int = None,
+    backend: GenerationBackend = None,
+) -> list:
+    """
+    Build a multi-part video series from a long document.
+    
+    Parts are rendered in parallel worker processes and linked from an
+    index.md written alongside them.
+    
+    Args:
+        content_dict: Parsed content with title and sections
+        minutes_per_episode: Target duration of each episode
+        style: Style preset configuration
+        output_dir: Directory for part files and the index
+        workers: Worker processes (default: CPU count)
+        backend: Generation backend (default: RuleBasedBackend)
+    
+    Returns:
+        List of written part paths, in order
+    """
+    title = content_dict["title"]
+    parts = partition_sections(content_dict["sections"], minutes_per_episode)
+    total = len(parts)
+    
+    jobs = [
+        ({"title": title, "part": f"Part {i} of {total}", "sections": part}, minutes_per_episode, style, backend)
+        for i, part in enumerate(parts, 1)
+    ]
+    
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and total > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, total)) as pool:
+            rendered = list(pool.map(_render_part, jobs))
+    else:
+        rendered = [_render_part(job) for job in jobs]
+    
+    output_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    index = f"# {title}\n\n"
+    index += f"> **Episodes**: {total} × {minutes_per_episode} minutes  \n"
+    index += f"> **Style Preset**: {style['name']}\n\n"
+    
+    for i, (part, (transcript, summary)) in enumerate(zip(parts, rendered), 1):
+        path = output_dir / f"part-{i:02d}.md"
+        path.write_text(transcript, encoding="utf-8")
+        write_summary(path, summary)
+        paths.append(path)
+        
+        index += f"## [Part {i}: {part[0]['heading']}]({path.name})\n\n"
+        index += f"**Estimated Duration**: {summary['total_minutes']:.1f} minutes\n\n"
+        for section in part:
+            index += f"- {section['heading']}\n"
+        index += "\n"
+    
+    (output_dir / "index.md").write_text(index, encoding="utf-8")
+    return paths
+
+
+def build_outline(metadata: dict, target_minutes: float, preset: str) -> str:
+    """
+    Build the outline file listing each section's word budget.
+    
+    Args:
+        metadata: Normalizer sidecar or parsed content with title and sections
+        target_minutes: Target video duration in minutes
+        preset: Style preset name
+    
+    Returns:
+        Outline as Markdown string
+    """
+    outline = f"# Transcript Outline\n\n"
+    outline += f"**Title**: {metadata['title']}\n"
+    outline += f"**Duration**: {target_minutes} minutes\n"
+    outline += f"**Style**: {preset}\n\n"
+    outline += "## Section Breakdown\n\n"
+    
+    target_words = int(target_minutes * WORDS_PER_MINUTE)
+    allocated = allocate_word_budget(metadata['sections'], target_words)
+    
+    for i, section in enumerate(allocated, 1):
+        outline += f"{i}. {section['heading']} ({section['word_budget']} words)\n"
+    
+    return outline
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Build video transcript from normalized notes"
@@ -363,9 +1122,92 @@ def main():
         type=str,
         help="Optional: output path for outline file"
     )
+    parser.add_argument(
+        "--backend",
+        type=str,
+        default="rules",
+        choices=BACKENDS,
+        help="Generation backend (default: rules)"
+    )
+    parser.add_argument(
+        "--backend-url",
+        type=str,
+        help="Server URL for the http backend"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        help="Optional: directory for the generated-text cache"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        help=f"Maximum cached responses (default: {DEFAULT_CACHE_SIZE})"
+    )
+    parser.add_argument(
+        "--render-cache",
+        type=str,
+        help="Optional: directory for per-document rendered sections; "
+             "rebuilds only re-render sections that changed"
+    )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help="Remove near-duplicate paragraphs before planning the transcript"
+    )
+    parser.add_argument(
+        "--dedup-against",
+        nargs="+",
+        metavar="PATH",
+        help="Also remove paragraphs already covered by these notes (files or "
+             "directories); implies --dedup"
+    )
+    parser.add_argument(
+        "--dedup-mode",
+        type=str,
+        default="drop",
+        choices=DEDUP_MODES,
+        help="Drop repeats, or merge new sentences into the earlier paragraph (default: drop)"
+    )
+    parser.add_argument(
+        "--dedup-threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Similarity that counts as a duplicate (default: {DEFAULT_THRESHOLD})"
+    )
+    parser.add_argument(
+        "--deadline-ms",
+        type=float,
+        help="Optional: finish within this many milliseconds, degrading in order: "
+             "fewer sentences per section, skip the outline, headings only"
+    )
+    parser.add_argument(
+        "--series",
+        action="store_true",
+        help="Split long notes into a multi-part series (--minutes is per episode)"
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="series",
+        help="Output directory for series parts and index.md (default: series)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for series rendering (default: CPU count)"
+    )
     
     args = parser.parse_args()
     
+    # The deadline covers the whole run, starting now
+    deadline = None
+    if args.deadline_ms is not None:
+        if args.deadline_ms <= 0:
+            print("Error: --deadline-ms must be positive")
+            sys.exit(1)
+        deadline = Deadline(args.deadline_ms, outline=bool(args.outline))
+    
     # Validate input
     input_path = Path(args.input)
     if not input_path.exists():
@@ -381,45 +1223,115 @@ def main():
     print(f"  Target: {args.minutes} minutes")
     print(f"  Style: {args.preset}")
     
-    input_text = input_path.read_text(encoding="utf-8")
+    with _stage(deadline, "load"):
+        input_text = input_path.read_text(encoding="utf-8")
+        
+        # Get script directory and find resources
+        script_dir = Path(__file__).parent
+        resources_dir = script_dir.parent / "resources"
+        
+        # Load style
+        try:
+            style = load_style_preset(args.preset, resources_dir)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
     
-    # Get script directory and find resources
-    script_dir = Path(__file__).parent
-    resources_dir = script_dir.parent / "resources"
+    # Optional near-duplicate removal; changed text no longer matches the sidecar
+    dedup_report = None
+    if args.dedup or args.dedup_against:
+        with _stage(deadline, "dedup"):
+            index = ParagraphIndex(args.dedup_threshold)
+            if args.dedup_against:
+                index_references(collect_paths(args.dedup_against), index, exclude_text=input_text)
+            input_text, dedup_report = dedup_text(
+                input_text, index, str(input_path), args.dedup_mode, args.dedup_threshold
+            )
+        print(f"  Dedup: {dedup_report['duplicates']} duplicate paragraphs, "
+              f"{dedup_report['words_saved']} words saved")
     
-    # Load style
-    style = load_style_preset(args.preset, resources_dir)
+    # Planning and outline work can use the normalizer's sidecar as-is
+    metadata = load_metadata_sidecar(input_path, input_text)
+    if metadata:
+        print(f"  Metadata: {input_path.with_suffix('.meta.json').name}")
     
     # Parse content
-    content_dict = parse_content(input_text)
-    print(f"  Sections: {len(content_dict['sections'])}")
+    with _stage(deadline, "parse"):
+        content_dict = parse_content(input_text)
+    if metadata is None:
+        metadata = {
+            "title": content_dict["title"],
+            "sections": content_dict["sections"],
+        }
+    print(f"  Sections: {len(metadata['sections'])}")
+    
+    # Generation backend
+    try:
+        backend = create_backend(args.backend, args.backend_url, args.cache_dir, args.cache_size)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    
+    # Series mode: one transcript per episode plus an index
+    if args.series:
+        if deadline is not None:
+            print("Warning: --deadline-ms is not applied to series builds")
+        if args.outline:
+            print("Warning: --outline is not applied to series builds")
+        if args.render_cache:
+            print("Warning: --render-cache is not applied to series builds")
+        output_dir = Path(args.output_dir)
+        paths = build_series(content_dict, args.minutes, style, output_dir, args.workers, backend)
+        print(f"\n✓ Series generated: {len(paths)} episodes in {output_dir}")
+        print(f"✓ Index: {output_dir / 'index.md'}")
+        return
+    
+    # Build transcript, reusing unchanged sections from the last build
+    render_cache = None
+    if args.render_cache:
+        render_cache = load_render_cache(Path(args.render_cache), input_path)
+    
+    transcript, summary = render_transcript(
+        content_dict, args.minutes, style, backend=backend, render_cache=render_cache, deadline=deadline
+    )
+    
+    if dedup_report is not None:
+        summary["dedup"] = {
+            key: dedup_report[key]
+            for key in ["paragraphs", "duplicates", "merged", "words_before", "words_saved"]
+        }
     
-    # Build transcript
-    transcript = build_transcript(content_dict, args.minutes, style)
+    if render_cache is not None:
+        save_render_cache(Path(args.render_cache), input_path, render_cache)
+        total = summary["sections_reused"] + summary["sections_rendered"]
+        print(f"  Sections reused: {summary['sections_reused']} of {total}")
     
     # Write output
     output_path = Path(args.output)
-    output_path.write_text(transcript, encoding="utf-8")
+    with _stage(deadline, "write"):
+        output_path.write_text(transcript, encoding="utf-8")
     
     print(f"\n✓ Transcript generated: {output_path}")
     
-    # Generate outline if requested
-    if args.outline:
+    # Generate outline if requested and there is still time for it
+    if args.outline and (deadline is None or deadline.outline):
         outline_path = Path(args.outline)
-        outline = f"# Transcript Outline\n\n"
-        outline += f"**Title**: {content_dict['title']}\n"
-        outline += f"**Duration**: {args.minutes} minutes\n"
-        outline += f"**Style**: {args.preset}\n\n"
-        outline += "## Section Breakdown\n\n"
-        
-        target_words = int(args.minutes * WORDS_PER_MINUTE)
-        allocated = allocate_word_budget(content_dict['sections'], target_words)
-        
-        for i, section in enumerate(allocated, 1):
-            outline += f"{i}. {section['heading']} ({section['word_budget']} words)\n"
-        
-        outline_path.write_text(outline, encoding="utf-8")
+        with _stage(deadline, "outline"):
+            outline_path.write_text(build_outline(metadata, args.minutes, args.preset), encoding="utf-8")
         print(f"✓ Outline generated: {outline_path}")
+    elif args.outline:
+        print("  Outline skipped to meet the deadline")
+    
+    if deadline is not None:
+        summary["deadline"] = deadline.report()
+        report = summary["deadline"]
+        print(f"  Deadline: {report['elapsed_ms']:.0f} of {report['deadline_ms']:g} ms"
+              f"{' (missed)' if not report['met'] else ''}")
+        if report["degradations"]:
+            print(f"  Degraded: {', '.join(report['degradations'])}")
+    
+    print(f"✓ Summary: {write_summary(output_path, summary)} "
+          f"({summary['total_minutes']:.1f} minutes, {summary['total_words']} words)")
     
     print("\nTranscript is ready for review and recording!")
 
@@ -0,0 +1,447 @@
+#!/usr/bin/env python3
+"""
+Remove near-duplicate paragraphs from normalized notes.
+
+Notes often restate the same material, which wastes the transcript's word
+budget and generation calls. Each prose paragraph is fingerprinted with a
+MinHash signature over word shingles and looked up in a banded LSH index,
+so it is only compared with the few earlier paragraphs that share a band;
+work grows linearly with the number of paragraphs. Repeats are dropped,
+or merged into the paragraph they repeat when both are in one document.
+
+The index can be shared across documents to remove material already
+covered elsewhere in the corpus (e.g. the reference notes).
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from normalize_notes import (
+    TOKEN_RE,
+    count_words,
+    find_code_spans,
+    iter_lines,
+    join_normalized,
+    normalize_notes,
+)
+
+
+# Constants
+SHINGLE_WORDS = 3  # Words per shingle
+NUM_PERM = 64  # MinHash signature length
+BANDS = 16  # LSH bands of NUM_PERM // BANDS rows each
+DEFAULT_THRESHOLD = 0.8  # Shingle Jaccard similarity that counts as a duplicate
+MIN_PARAGRAPH_WORDS = 8  # Shorter paragraphs are never treated as duplicates
+MODES = ["drop", "merge"]
+
+DENSIFY_OFFSET = 1 << 58  # Above any bin rank, keeps borrowed values distinct
+
+HEADING_RE = re.compile(r"^#{1,6}\s")
+SEPARATOR_RE = re.compile(r"^(-{3,}|\*{3,}|_{3,}|<!--.*-->)$")
+PUNCT_RE = re.compile(r"[^\w\s]")
+SENTENCE_RE = re.compile(r"(?<=[.!?。！？])\s+")
+
+
+def shingle_hashes(text: str) -> frozenset:
+    """
+    Hash the word shingles of a paragraph.
+    
+    Text is lowercased and stripped of punctuation first, so formatting
+    differences (bold, list markers, trailing periods) do not matter.
+    CJK characters count as words.
+    """
+    tokens = TOKEN_RE.findall(PUNCT_RE.sub(" ", text.lower()))
+    if len(tokens) <= SHINGLE_WORDS:
+        shingles = [" ".join(tokens)]
+    else:
+        shingles = [" ".join(tokens[i:i + SHINGLE_WORDS]) for i in range(len(tokens) - SHINGLE_WORDS + 1)]
+    
+    return frozenset(
+        int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+        for shingle in shingles
+    )
+
+
+def minhash(shingles: frozenset) -> tuple:
+    """
+    Compute a one-permutation MinHash signature of shingle hashes.
+    
+    Each hash is routed to one of NUM_PERM bins by its low bits and each
+    bin keeps its minimum, so a signature costs one pass over the
+    shingles. Empty bins borrow the value of the next non-empty bin
+    (rotation densification), offset by the distance so they stay
+    distinct, which keeps signatures comparable band by band.
+    """
+    bins = [None] * NUM_PERM
+    for value in shingles:
+        slot = value % NUM_PERM
+        rank = value // NUM_PERM
+        if bins[slot] is None or rank < bins[slot]:
+            bins[slot] = rank
+    
+    if None in bins:
+        # Sweep right to left over two laps so every empty bin has seen
+        # the nearest filled bin after it, wrapping around
+        source = list(bins)
+        nearest = None
+        for i in range(2 * NUM_PERM - 1, -1, -1):
+            if source[i % NUM_PERM] is not None:
+                nearest = i
+            elif i < NUM_PERM:
+                bins[i] = source[nearest % NUM_PERM] + (nearest - i) * DENSIFY_OFFSET
+    
+    return tuple(bins)
+
+
+def jaccard(first: frozenset, second: frozenset) -> float:
+    """Exact Jaccard similarity of two shingle sets."""
+    if not first or not second:
+        return 0.0
+    overlap = len(first & second)
+    return overlap / (len(first) + len(second) - overlap)
+
+
+class ParagraphIndex:
+    """
+    Banded LSH index of paragraph MinHash signatures.
+    
+    A signature is split into BANDS bands; paragraphs sharing any band
+    land in the same bucket and become candidates. Candidates are then
+    checked with exact Jaccard similarity, so LSH only decides which few
+    pairs get compared.
+    """
+    
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.rows = NUM_PERM // BANDS
+        self.buckets = {}
+        self.entries = []
+    
+    def _bands(self, signature: tuple):
+        rows = self.rows
+        for band in range(BANDS):
+            yield (band, signature[band * rows:(band + 1) * rows])
+    
+    def find(self, signature: tuple, shingles: frozenset):
+        """
+        Find the most similar indexed paragraph.
+        
+        Returns:
+            (entry, similarity) for the best match at or above the
+            threshold, or None
+        """
+        candidates = set()
+        for key in self._bands(signature):
+            candidates.update(self.buckets.get(key, ()))
+        
+        best = None
+        for entry_id in sorted(candidates):
+            entry = self.entries[entry_id]
+            similarity = jaccard(shingles, entry["shingles"])
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (entry, similarity)
+        
+        return best
+    
+    def add(self, signature: tuple, shingles: frozenset, source: str, paragraph: dict) -> dict:
+        """Index a paragraph and return its entry."""
+        entry = {"id": len(self.entries), "source": source, "paragraph": paragraph, "shingles": shingles}
+        self.entries.append(entry)
+        for key in self._bands(signature):
+            self.buckets.setdefault(key, []).append(entry["id"])
+        return entry
+
+
+def split_paragraphs(text: str) -> tuple:
+    """
+    Split normalized text into lines and prose paragraphs.
+    
+    A paragraph is a run of non-blank lines outside fenced code that are
+    not headings or separators (list items and table rows included).
+    
+    Returns:
+        (lines, paragraphs) tuple; each paragraph dict holds its first and
+        last line index ("first", "last") and its "text"
+    """
+    lines = []
+    paragraphs = []
+    current = None
+    
+    for i, (_, line, span) in enumerate(iter_lines(text, find_code_spans(text))):
+        lines.append(line)
+        stripped = line.strip()
+        
+        if span or not stripped or HEADING_RE.match(stripped) or SEPARATOR_RE.match(stripped):
+            current = None
+            continue
+        
+        if current is None:
+            current = {"first": i, "last": i}
+            paragraphs.append(current)
+        current["last"] = i
+    
+    for paragraph in paragraphs:
+        paragraph["text"] = "\n".join(lines[paragraph["first"]:paragraph["last"] + 1])
+    
+    return lines, paragraphs
+
+
+def _merge_units(text: str) -> list:
+    """Split a paragraph into mergeable units: lines for lists, else sentences."""
+    if "\n" in text:
+        return text.split("\n")
+    return SENTENCE_RE.split(text)
+
+
+def _unit_key(unit: str) -> str:
+    return " ".join(PUNCT_RE.sub(" ", unit.lower()).split())
+
+
+def merge_paragraphs(kept: str, duplicate: str) -> str:
+    """
+    Append the sentences (or list lines) of duplicate that kept lacks.
+    
+    Returns:
+        Merged paragraph text; kept unchanged if nothing is new
+    """
+    seen = {_unit_key(unit) for unit in _merge_units(kept)}
+    novel = [unit for unit in _merge_units(duplicate) if unit.strip() and _unit_key(unit) not in seen]
+    if not novel:
+        return kept
+    
+    separator = "\n" if "\n" in kept or "\n" in duplicate else " "
+    return kept + separator + separator.join(novel)
+
+
+def dedup_text(
+    text: str,
+    index: ParagraphIndex = None,
+    source: str = "",
+    mode: str = "drop",
+    threshold: float = DEFAULT_THRESHOLD,
+) -> tuple:
+    """
+    Remove near-duplicate paragraphs from normalized Markdown.
+    
+    Args:
+        text: Normalized Markdown
+        index: Shared ParagraphIndex for cross-document dedup (default: a
+            fresh index, i.e. within this document only)
+        source: Name recorded for this document's paragraphs in the index
+        mode: "drop" removes repeats; "merge" also appends sentences a
+            repeat adds to an earlier paragraph of the same document
+            (repeats of other documents are always dropped)
+        threshold: Shingle Jaccard similarity that counts as a duplicate
+    
+    Returns:
+        (text, report) tuple; report holds paragraph counts, words before
+        and after, words_saved and the matched duplicates
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown dedup mode: {mode}")
+    if index is None:
+        index = ParagraphIndex(threshold)
+    
+    lines, paragraphs = split_paragraphs(text)
+    dropped = set()
+    merged = {}
+    matches = []
+    
+    for number, paragraph in enumerate(paragraphs, 1):
+        if count_words(paragraph["text"], []) < MIN_PARAGRAPH_WORDS:
+            continue
+        
+        shingles = shingle_hashes(paragraph["text"])
+        signature = minhash(shingles)
+        match = index.find(signature, shingles)
+        
+        if match is None:
+            index.add(signature, shingles, source, paragraph)
+            continue
+        
+        entry, similarity = match
+        dropped.update(range(paragraph["first"], paragraph["last"] + 1))
+        matches.append({
+            "paragraph": number,
+            "line": paragraph["first"] + 1,
+            "source": entry["source"],
+            "similarity": round(similarity, 3),
+            "words": count_words(paragraph["text"], []),
+        })
+        
+        if mode == "merge" and entry["source"] == source:
+            original = entry["paragraph"]
+            current = merged.get(original["first"], original["text"])
+            merged[original["first"]] = merge_paragraphs(current, paragraph["text"])
+    
+    # Rebuild from the kept lines; merged paragraphs replace their originals
+    last_lines = {paragraph["first"]: paragraph["last"] for paragraph in paragraphs}
+    kept_lines = []
+    skip_until = -1
+    for i, line in enumerate(lines):
+        if i in dropped or i <= skip_until:
+            continue
+        if i in merged:
+            kept_lines.extend(merged[i].split("\n"))
+            skip_until = last_lines[i]
+            continue
+        kept_lines.append(line)
+    
+    result = join_normalized(kept_lines) if matches else text
+    words_before = count_words(text)
+    words_after = count_words(result)
+    
+    report = {
+        "source": source,
+        "paragraphs": len(paragraphs),
+        "duplicates": len(matches),
+        "merged": len(merged),
+        "words_before": words_before,
+        "words_after": words_after,
+        "words_saved": words_before - words_after,
+        "matches": matches,
+    }
+    return result, report
+
+
+def collect_paths(inputs: list) -> list:
+    """Expand files and directories (their *.md files) into a path list."""
+    paths = []
+    for item in inputs:
+        path = Path(item)
+        if path.is_dir():
+            paths.extend(sorted(path.glob("*.md")))
+        elif path.exists():
+            paths.append(path)
+        else:
+            print(f"Warning: Skipping missing path: {path}")
+    return paths
+
+
+def index_references(paths: list, index: ParagraphIndex, exclude_text: str = None) -> int:
+    """
+    Add the paragraphs of reference documents to a shared index.
+    
+    Reference files are normalized first so their paragraphs split the
+    same way as normalized input. A reference whose normalized text equals
+    exclude_text is the document being deduplicated and is skipped.
+    
+    Returns:
+        Number of documents indexed
+    """
+    indexed = 0
+    for path in paths:
+        text = normalize_notes(path.read_text(encoding="utf-8"))
+        if text == exclude_text:
+            continue
+        dedup_text(text, index, source=str(path))
+        indexed += 1
+    return indexed
+
+
+def dedup_corpus(
+    paths: list,
+    mode: str = "drop",
+    threshold: float = DEFAULT_THRESHOLD,
+    across: bool = False,
+) -> list:
+    """
+    Normalize and dedup many documents.
+    
+    Args:
+        paths: Markdown files, processed in order
+        mode: "drop" or "merge" (see dedup_text())
+        threshold: Shingle Jaccard similarity that counts as a duplicate
+        across: Share one index so later documents also lose paragraphs
+            that repeat earlier ones
+    
+    Returns:
+        List of (path, text, report) tuples
+    """
+    shared = ParagraphIndex(threshold) if across else None
+    results = []
+    for path in paths:
+        text = normalize_notes(path.read_text(encoding="utf-8"))
+        deduped, report = dedup_text(text, shared, str(path), mode, threshold)
+        results.append((path, deduped, report))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Remove near-duplicate paragraphs from notes"
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="+",
+        type=str,
+        help="Markdown files or directories to dedup"
+    )
+    parser.add_argument(
+        "--across",
+        action="store_true",
+        help="Also drop paragraphs that repeat earlier documents in the corpus"
+    )
+    parser.add_argument(
+        "--mode",
+        type=str,
+        default="drop",
+        choices=MODES,
+        help="Drop repeats, or merge new sentences into the earlier paragraph (default: drop)"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Similarity that counts as a duplicate (default: {DEFAULT_THRESHOLD})"
+    )
+    parser.add_argument(
+        "-o", "--output-dir",
+        type=str,
+        help="Optional: write normalized, deduplicated files to this directory"
+    )
+    parser.add_argument(
+        "--json",
+        type=str,
+        help="Optional: write the per-document report as JSON to this path"
+    )
+    
+    args = parser.parse_args()
+    
+    paths = collect_paths(args.inputs)
+    if not paths:
+        print("Error: No input files found")
+        sys.exit(1)
+    
+    results = dedup_corpus(paths, args.mode, args.threshold, args.across)
+    
+    total_before = sum(report["words_before"] for _, _, report in results)
+    total_saved = sum(report["words_saved"] for _, _, report in results)
+    
+    for path, _, report in results:
+        if report["duplicates"]:
+            print(f"  {path.name}: {report['duplicates']} duplicate paragraphs, "
+                  f"{report['words_saved']} words saved")
+    
+    percent = total_saved / total_before * 100 if total_before else 0.0
+    print(f"\n✓ {len(results)} documents, {total_saved} of {total_before} words saved ({percent:.1f}%)")
+    
+    if args.output_dir:
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        for path, text, _ in results:
+            (output_dir / path.name).write_text(text, encoding="utf-8")
+        print(f"✓ Deduplicated files saved to: {output_dir}")
+    
+    if args.json:
+        reports = [report for _, _, report in results]
+        Path(args.json).write_text(json.dumps(reports, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"✓ Report saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
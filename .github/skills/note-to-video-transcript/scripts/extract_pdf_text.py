@@ -7,6 +7,8 @@ preserving structure and readability for downstream processing.
 """
 
 import argparse
+import multiprocessing
+import queue
 import sys
 from pathlib import Path
 
@@ -17,14 +19,110 @@ except ImportError:
     print("Install it with: pip install pdfplumber")
     sys.exit(1)
 
+from normalize_notes import (
+    join_normalized,
+    normalize_lines,
+    track_metadata,
+    write_metadata_sidecar,
+)
 
-def extract_pdf_text(pdf_path: Path, output_path: Path) -> bool:
+
+# Scanned-PDF pre-check defaults
+DEFAULT_SAMPLE_PAGES = 5
+DEFAULT_MIN_PAGE_CHARS = 20
+DEFAULT_MIN_TEXT_RATIO = 0.2
+
+# Pipelined extract -> normalize defaults
+DEFAULT_QUEUE_PAGES = 16  # Pages buffered per extraction worker
+DEFAULT_PIPELINE_WORKERS = 1
+
+
+def sample_page_indexes(total_pages: int, sample_pages: int) -> list:
+    """
+    Pick up to sample_pages page indexes spread evenly across a document.
+    
+    The first and last pages are always included so cover pages and
+    appendices are represented.
+    """
+    if sample_pages <= 0 or total_pages == 0:
+        return []
+    if sample_pages >= total_pages:
+        return list(range(total_pages))
+    if sample_pages == 1:
+        return [0]
+    
+    step = (total_pages - 1) / (sample_pages - 1)
+    return sorted({round(i * step) for i in range(sample_pages)})
+
+
+def page_separator(page_number: int) -> str:
+    """Return the Markdown separator placed before a page's text."""
+    return f"\n\n---\n<!-- Page {page_number} -->\n\n"
+
+
+def page_has_text_layer(page, min_chars: int) -> bool:
+    """
+    Check whether a page carries a real text layer.
+    
+    Counts the page's glyphs, including those drawn through form
+    XObjects, which is much cheaper than a full extract_text() layout
+    pass.
+    """
+    return len(page.chars) >= min_chars
+
+
+def detect_scanned_pdf(
+    pdf,
+    sample_pages: int = DEFAULT_SAMPLE_PAGES,
+    min_page_chars: int = DEFAULT_MIN_PAGE_CHARS,
+    min_text_ratio: float = DEFAULT_MIN_TEXT_RATIO,
+) -> dict:
+    """
+    Sample a handful of pages to decide whether a PDF is image-only.
+    
+    Args:
+        pdf: Open pdfplumber PDF
+        sample_pages: Number of pages to inspect
+        min_page_chars: Glyphs a page needs to count as having text
+        min_text_ratio: Fraction of sampled pages that must have text
+    
+    Returns:
+        Dict with sampled page numbers (1-based), text_pages count and a
+        scanned flag
+    """
+    indexes = sample_page_indexes(len(pdf.pages), sample_pages)
+    text_pages = [
+        i + 1 for i in indexes
+        if page_has_text_layer(pdf.pages[i], min_page_chars)
+    ]
+    
+    scanned = bool(indexes) and len(text_pages) < min_text_ratio * len(indexes)
+    
+    return {
+        "sampled": [i + 1 for i in indexes],
+        "text_pages": text_pages,
+        "scanned": scanned,
+    }
+
+
+def extract_pdf_text(
+    pdf_path: Path,
+    output_path: Path,
+    sample_pages: int = DEFAULT_SAMPLE_PAGES,
+    min_page_chars: int = DEFAULT_MIN_PAGE_CHARS,
+    min_text_ratio: float = DEFAULT_MIN_TEXT_RATIO,
+    force_full: bool = False,
+) -> bool:
     """
     Extract text from a PDF file and save as Markdown.
     
     Args:
         pdf_path: Path to input PDF file
         output_path: Path to output Markdown file
+        sample_pages: Pages to sample in the scanned-PDF pre-check
+        min_page_chars: Glyphs a sampled page needs to count as text
+        min_text_ratio: Fraction of sampled pages that must have text
+        force_full: Skip the pre-check and always extract every page
     
     Returns:
         True if extraction successful, False otherwise
@@ -37,6 +135,15 @@ def extract_pdf_text(pdf_path: Path, output_path: Path) -> bool:
                 print(f"Warning: PDF has no pages: {pdf_path}")
                 return False
             
+            # Bail out early on image-only PDFs instead of extracting every page
+            if not force_full:
+                check = detect_scanned_pdf(pdf, sample_pages, min_page_chars, min_text_ratio)
+                if check["scanned"]:
+                    print(f"Warning: No text layer on sampled pages {check['sampled']}")
+                    print("This PDF may contain scanned images rather than text.")
+                    print("Consider using OCR tools instead, or pass --full to extract anyway.")
+                    return False
+            
             print(f"Processing {total_pages} pages from {pdf_path.name}...")
             
             # Extract text from all pages
@@ -47,7 +154,7 @@ def extract_pdf_text(pdf_path: Path, output_path: Path) -> bool:
                 if text:
                     # Add page separator for multi-page PDFs
                     if i > 1:
-                        extracted_text.append(f"\n\n---\n<!-- Page {i} -->\n\n")
+                        extracted_text.append(page_separator(i))
                     extracted_text.append(text)
                 else:
                     print(f"Warning: No text found on page {i}")
@@ -69,13 +176,210 @@ def extract_pdf_text(pdf_path: Path, output_path: Path) -> bool:
             print(f"✓ Extracted {len(full_text)} characters")
             print(f"✓ Saved to: {output_path}")
             return True
+    
+    except FileNotFoundError:
+        print(f"Error: PDF file not found: {pdf_path}")
+        return False
+    except Exception as e:
+        print(f"Error extracting PDF: {e}")
+        return False
+
+
+def _extract_pages(pdf_path: Path, first_page: int, step: int, page_queue):
+    """
+    Extraction worker: push (page_number, text) for every step-th page.
+    
+    Runs in its own process. put() blocks while the queue is full, which
+    keeps a slow consumer from letting extracted pages pile up in memory.
+    Failures are reported as (None, message).
+    """
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            for index in range(first_page - 1, len(pdf.pages), step):
+                page = pdf.pages[index]
+                page_queue.put((index + 1, page.extract_text() or ""))
+                # Release parsed objects; the page is not needed again
+                page.close()
+    except Exception as e:
+        page_queue.put((None, str(e)))
+
+
+def _measure_chunk(chunk: str, stats: dict) -> str:
+    """
+    Update running length statistics with one chunk and return it.
+    
+    Leading whitespace before the first text and trailing whitespace
+    after the latest text are tracked so "text_chars" always equals the
+    length of the stripped concatenation so far.
+    """
+    stats["chars"] += len(chunk)
+    if chunk.strip():
+        if not stats["has_text"]:
+            stats["lead"] += len(chunk) - len(chunk.lstrip())
+            stats["has_text"] = True
+        stats["trail"] = len(chunk) - len(chunk.rstrip())
+    elif stats["has_text"]:
+        stats["trail"] += len(chunk)
+    else:
+        stats["lead"] += len(chunk)
+    
+    if stats["has_text"]:
+        stats["text_chars"] = stats["chars"] - stats["lead"] - stats["trail"]
+    return chunk
+
+
+def _next_page(page_queue, process) -> tuple:
+    """Wait for the next page from a worker, failing if the worker died."""
+    while True:
+        try:
+            return page_queue.get(timeout=1.0)
+        except queue.Empty:
+            if not process.is_alive() and page_queue.empty():
+                raise RuntimeError(f"Extraction worker exited with code {process.exitcode}")
+
+
+def _iter_page_chunks(queues: list, processes: list, total_pages: int, stats: dict):
+    """
+    Yield extracted text chunks in page order from the worker queues.
+    
+    Page n comes from worker (n - 1) % len(queues), so reading the queues
+    round-robin restores document order without a reorder buffer.
+    Chunks are identical to what extract_pdf_text() concatenates. stats
+    receives the total length ("chars") and the length after strip()
+    ("text_chars") of the concatenation, without keeping it in memory.
+    """
+    for i in range(1, total_pages + 1):
+        worker = (i - 1) % len(queues)
+        page_number, text = _next_page(queues[worker], processes[worker])
+        if page_number is None:
+            raise RuntimeError(text)
+        
+        if text:
+            if i > 1:
+                yield _measure_chunk(page_separator(i), stats)
+            yield _measure_chunk(text, stats)
+        else:
+            print(f"Warning: No text found on page {i}")
+
+
+def _iter_chunk_lines(chunks):
+    """
+    Split a stream of text chunks into lines.
+    
+    Equivalent to "".join(chunks).split("\n"), holding back only the
+    unterminated tail of the latest chunk.
+    """
+    carry = ""
+    for chunk in chunks:
+        pieces = (carry + chunk).split("\n")
+        carry = pieces.pop()
+        yield from pieces
+    yield carry
+
+
+def extract_and_normalize(
+    pdf_path: Path,
+    output_path: Path,
+    workers: int = DEFAULT_PIPELINE_WORKERS,
+    queue_pages: int = DEFAULT_QUEUE_PAGES,
+    sample_pages: int = DEFAULT_SAMPLE_PAGES,
+    min_page_chars: int = DEFAULT_MIN_PAGE_CHARS,
+    min_text_ratio: float = DEFAULT_MIN_TEXT_RATIO,
+    force_full: bool = False,
+) -> bool:
+    """
+    Extract a PDF and normalize it in one pipelined pass.
+    
+    Extraction workers run in separate processes and push page text into
+    bounded queues; this process streams the pages, in order, through
+    normalize_notes' line normalizer while later pages are still being
+    extracted. The output (and its metadata sidecar) is identical to
+    running extract_pdf_text() followed by normalize_notes.py.
+    
+    Args:
+        pdf_path: Path to input PDF file
+        output_path: Path to the normalized Markdown file
+        workers: Extraction worker processes
+        queue_pages: Pages each worker may buffer ahead of the normalizer
+        sample_pages: Pages to sample in the scanned-PDF pre-check
+        min_page_chars: Glyphs a sampled page needs to count as text
+        min_text_ratio: Fraction of sampled pages that must have text
+        force_full: Skip the pre-check and always extract every page
+    
+    Returns:
+        True if extraction and normalization succeeded, False otherwise
+    """
+    try:
+        with pdfplumber.open(pdf_path) as pdf:
+            total_pages = len(pdf.pages)
             
+            if total_pages == 0:
+                print(f"Warning: PDF has no pages: {pdf_path}")
+                return False
+            
+            if not force_full:
+                check = detect_scanned_pdf(pdf, sample_pages, min_page_chars, min_text_ratio)
+                if check["scanned"]:
+                    print(f"Warning: No text layer on sampled pages {check['sampled']}")
+                    print("This PDF may contain scanned images rather than text.")
+                    print("Consider using OCR tools instead, or pass --full to extract anyway.")
+                    return False
     except FileNotFoundError:
         print(f"Error: PDF file not found: {pdf_path}")
         return False
     except Exception as e:
         print(f"Error extracting PDF: {e}")
         return False
+    
+    workers = max(1, min(workers, total_pages))
+    print(f"Processing {total_pages} pages from {pdf_path.name} "
+          f"({workers} extraction worker{'s' if workers > 1 else ''})...")
+    
+    queues = [multiprocessing.Queue(maxsize=max(1, queue_pages)) for _ in range(workers)]
+    processes = [
+        multiprocessing.Process(
+            target=_extract_pages,
+            args=(pdf_path, first_page, workers, queues[first_page - 1]),
+            daemon=True,
+        )
+        for first_page in range(1, workers + 1)
+    ]
+    for process in processes:
+        process.start()
+    
+    stats = {"chars": 0, "text_chars": 0, "lead": 0, "trail": 0, "has_text": False}
+    metadata = {}
+    
+    try:
+        chunks = _iter_page_chunks(queues, processes, total_pages, stats)
+        lines = track_metadata(normalize_lines(_iter_chunk_lines(chunks)), metadata)
+        normalized_text = join_normalized(lines)
+    except Exception as e:
+        print(f"Error extracting PDF: {e}")
+        return False
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        for page_queue in queues:
+            page_queue.close()
+    
+    # Same validation as extract_pdf_text(), on the raw extracted size
+    if stats["text_chars"] < 100:
+        print(f"Warning: Extracted text is very short ({stats['chars']} chars)")
+        print("This PDF may contain scanned images rather than text.")
+        print("Consider using OCR tools instead.")
+        return False
+    
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(normalized_text, encoding="utf-8")
+    meta_path = write_metadata_sidecar(output_path, normalized_text, metadata)
+    
+    print(f"✓ Extracted {stats['chars']} characters")
+    print(f"✓ Normalized content saved to: {output_path}")
+    print(f"✓ Metadata saved to: {meta_path}")
+    return True
 
 
 def main():
@@ -93,6 +397,47 @@ def main():
         default=".tmp/extracted.md",
         help="Output path for extracted text (default: .tmp/extracted.md)"
     )
+    parser.add_argument(
+        "--sample-pages",
+        type=int,
+        default=DEFAULT_SAMPLE_PAGES,
+        help=f"Pages to sample when checking for scanned PDFs (default: {DEFAULT_SAMPLE_PAGES})"
+    )
+    parser.add_argument(
+        "--min-page-chars",
+        type=int,
+        default=DEFAULT_MIN_PAGE_CHARS,
+        help=f"Characters a sampled page needs to count as text (default: {DEFAULT_MIN_PAGE_CHARS})"
+    )
+    parser.add_argument(
+        "--min-text-ratio",
+        type=float,
+        default=DEFAULT_MIN_TEXT_RATIO,
+        help=f"Fraction of sampled pages that must have text (default: {DEFAULT_MIN_TEXT_RATIO})"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Skip the scanned-PDF check and extract every page"
+    )
+    parser.add_argument(
+        "--normalize-to",
+        type=str,
+        help="Pipeline extraction straight into normalization and write "
+             "normalized Markdown (plus metadata sidecar) to this path"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_PIPELINE_WORKERS,
+        help=f"Extraction worker processes for --normalize-to (default: {DEFAULT_PIPELINE_WORKERS})"
+    )
+    parser.add_argument(
+        "--queue-pages",
+        type=int,
+        default=DEFAULT_QUEUE_PAGES,
+        help=f"Pages each worker may buffer ahead of the normalizer (default: {DEFAULT_QUEUE_PAGES})"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -110,9 +455,37 @@ def main():
     if pdf_path.suffix.lower() != ".pdf":
         print(f"Warning: File does not have .pdf extension: {pdf_path}")
     
+    # Extract and normalize in one pipelined pass
+    if args.normalize_to:
+        normalized_path = Path(args.normalize_to)
+        success = extract_and_normalize(
+            pdf_path,
+            normalized_path,
+            workers=args.workers,
+            queue_pages=args.queue_pages,
+            sample_pages=args.sample_pages,
+            min_page_chars=args.min_page_chars,
+            min_text_ratio=args.min_text_ratio,
+            force_full=args.full,
+        )
+        
+        if not success:
+            sys.exit(1)
+        
+        print("\nNext steps:")
+        print(f"  python scripts/build_transcript.py --input {normalized_path} --minutes 6")
+        return
+    
     # Extract text
     output_path = Path(args.output)
-    success = extract_pdf_text(pdf_path, output_path)
+    success = extract_pdf_text(
+        pdf_path,
+        output_path,
+        sample_pages=args.sample_pages,
+        min_page_chars=args.min_page_chars,
+        min_text_ratio=args.min_text_ratio,
+        force_full=args.full,
+    )
     
     if not success:
         sys.exit(1)
@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+Pluggable text generation backends for transcript building.
+
+A backend turns generation requests (hook, intro, section, recap, CTA)
+into spoken text. build_transcript.py ships a rule-based backend; this
+module adds an HTTP backend for model servers, a deterministic stub
+server for tests, and an on-disk response cache that wraps any backend.
+
+Run as a script to start the stub server:
+
+    python scripts/generation_backends.py --port 8765
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+# Constants
+REQUEST_KINDS = ["hook", "intro", "section", "recap", "cta"]
+DEFAULT_CACHE_SIZE = 2048  # Cached responses kept on disk
+DEFAULT_BATCH_SIZE = 8  # Requests per HTTP call
+DEFAULT_MAX_WORKERS = 4  # Concurrent batches in flight
+
+
+class GenerationBackend:
+    """
+    Base class for generation backends.
+    
+    Subclasses implement generate(); generate_batch() fans requests out
+    over a thread pool and may be overridden when the backend has a
+    native batch call. Backends whose output ignores a section's
+    word_budget set uses_word_budget to False, so budget shifts alone do
+    not invalidate their rendered sections. cache_id identifies the
+    backend's output in cache keys.
+    """
+    
+    name = "base"
+    uses_word_budget = True
+    
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.max_workers = max_workers
+    
+    @property
+    def cache_id(self) -> str:
+        """Backend identity for cache keys; the name unless output depends on more."""
+        return self.name
+    
+    def generate(self, request: dict, style: dict) -> str:
+        """
+        Generate text for one request.
+        
+        Args:
+            request: Dict with a "kind" (see REQUEST_KINDS) and the fields
+                that kind needs (title, headings, heading, content, ...)
+            style: Style preset configuration
+        
+        Returns:
+            Generated text
+        """
+        raise NotImplementedError
+    
+    def generate_batch(self, requests: list, style: dict, timeout: float = None) -> list:
+        """
+        Generate text for many requests, preserving order.
+        
+        Args:
+            requests: Requests as for generate()
+            style: Style preset configuration
+            timeout: Optional seconds to wait on a remote server, shorter
+                than the backend's own timeout; local backends ignore it
+        
+        Returns:
+            Generated texts aligned with requests
+        """
+        if self.max_workers <= 1 or len(requests) <= 1:
+            return [self.generate(request, style) for request in requests]
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return list(pool.map(lambda request: self.generate(request, style), requests))
+
+
+class HttpBackend(GenerationBackend):
+    """
+    Backend that posts batched requests to a generation server.
+    
+    The server receives {"style": ..., "requests": [...]} as JSON and
+    must answer {"responses": [...]} with one string per request.
+    """
+    
+    name = "http"
+    
+    def __init__(
+        self,
+        url: str,
+        timeout: float = 60.0,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        super().__init__(max_workers)
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.batch_size = batch_size
+    
+    @property
+    def cache_id(self) -> str:
+        # Different servers (or models behind them) answer differently
+        return f"{self.name}:{self.url}"
+    
+    def _post(self, requests: list, style: dict, timeout: float = None) -> list:
+        body = json.dumps({"style": style, "requests": requests}).encode("utf-8")
+        http_request = urllib.request.Request(
+            f"{self.url}/generate",
+            data=body,
+            headers={"Content-Type": "application/json"},
+        )
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        with urllib.request.urlopen(http_request, timeout=timeout) as response:
+            payload = json.loads(response.read().decode("utf-8"))
+        
+        responses = payload.get("responses", [])
+        if len(responses) != len(requests):
+            raise ValueError(
+                f"Backend returned {len(responses)} responses for {len(requests)} requests"
+            )
+        return responses
+    
+    def generate(self, request: dict, style: dict) -> str:
+        return self._post([request], style)[0]
+    
+    def generate_batch(self, requests: list, style: dict, timeout: float = None) -> list:
+        batches = [
+            requests[i:i + self.batch_size]
+            for i in range(0, len(requests), self.batch_size)
+        ]
+        
+        if self.max_workers <= 1 or len(batches) <= 1:
+            results = [self._post(batch, style, timeout) for batch in batches]
+        else:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                results = list(pool.map(lambda batch: self._post(batch, style, timeout), batches))
+        
+        return [text for batch in results for text in batch]
+
+
+class ResponseCache:
+    """
+    On-disk cache of generated text with LRU eviction.
+    
+    Each entry is a JSON file named by the hash of its key. Hits refresh
+    the file's mtime. evict() removes the least recently used files once
+    the cache holds more than max_entries; it scans the whole directory,
+    so callers run it once per batch of put() calls.
+    """
+    
+    def __init__(self, cache_dir: Path, max_entries: int = DEFAULT_CACHE_SIZE):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def key(request: dict, preset: str, backend: str) -> str:
+        """Hash a prompt, preset and backend cache_id into a cache key."""
+        material = json.dumps(
+            {"prompt": request, "preset": preset, "backend": backend},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def preset_key(style: dict) -> str:
+        """
+        Identify a style preset for cache keys.
+        
+        Includes the preset's fingerprint (a hash of its settings and
+        phrases) when present, so editing a preset invalidates its entries.
+        """
+        return f"{style['name']}:{style['fingerprint']}" if "fingerprint" in style else style["name"]
+    
+    def get(self, key: str):
+        """Return the cached text for key, or None."""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            text = json.loads(path.read_text(encoding="utf-8"))["text"]
+            os.utime(path)
+        except (OSError, ValueError, KeyError):
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return text
+    
+    def put(self, key: str, text: str):
+        """Store text under key; see evict() for the size cap."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"text": text}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, path)
+    
+    def evict(self):
+        """Remove the least recently used entries beyond max_entries."""
+        # Safe to race: concurrent writers may try to remove the same file
+        entries = list(self.cache_dir.glob("*.json"))
+        excess = len(entries) - self.max_entries
+        if excess <= 0:
+            return
+        
+        def mtime(path):
+            try:
+                return path.stat().st_mtime
+            except OSError:
+                return 0
+        
+        for path in sorted(entries, key=mtime)[:excess]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+
+class CachedBackend(GenerationBackend):
+    """Backend wrapper that serves repeated requests from a ResponseCache."""
+    
+    def __init__(self, backend: GenerationBackend, cache: ResponseCache):
+        super().__init__(backend.max_workers)
+        self.backend = backend
+        self.cache = cache
+        self.name = backend.name
+        self.uses_word_budget = backend.uses_word_budget
+    
+    @property
+    def cache_id(self) -> str:
+        return self.backend.cache_id
+    
+    def generate(self, request: dict, style: dict) -> str:
+        return self.generate_batch([request], style)[0]
+    
+    def generate_batch(self, requests: list, style: dict, timeout: float = None) -> list:
+        preset = ResponseCache.preset_key(style)
+        keys = [ResponseCache.key(request, preset, self.cache_id) for request in requests]
+        results = [self.cache.get(key) for key in keys]
+        
+        missing = [i for i, text in enumerate(results) if text is None]
+        if missing:
+            generated = self.backend.generate_batch([requests[i] for i in missing], style, timeout)
+            for i, text in zip(missing, generated):
+                self.cache.put(keys[i], text)
+                results[i] = text
+            self.cache.evict()
+        
+        return results
+
+
+def stub_response(request: dict, style: dict) -> str:
+    """
+    Deterministic text for a request, as served by the stub server.
+    
+    The output depends only on the request and preset name, so tests can
+    assert on it exactly.
+    """
+    label = request.get("heading") or request.get("title") or request["kind"]
+    digest = ResponseCache.key(request, style.get("name", ""), "stub")[:8]
+    return f"[{style.get('name', 'neutral')} {request['kind']}] {label} ({digest})"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        if self.path != "/generate":
+            self.send_error(404)
+            return
+        
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length).decode("utf-8"))
+        style = payload.get("style", {})
+        responses = [stub_response(request, style) for request in payload.get("requests", [])]
+        
+        body = json.dumps({"responses": responses}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """
+    Local generation server with deterministic responses, for tests.
+    
+    Usage:
+        with StubServer() as server:
+            backend = HttpBackend(server.url)
+    """
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self.httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self._thread = None
+    
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread:
+            self._thread.join()
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run the deterministic stub generation server"
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="Host to bind (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8765,
+        help="Port to listen on (default: 8765)"
+    )
+    
+    args = parser.parse_args()
+    
+    server = StubServer(args.host, args.port)
+    print(f"Stub generation server listening on {server.url}")
+    print("Press Ctrl+C to stop.")
+    
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
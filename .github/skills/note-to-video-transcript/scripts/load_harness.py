@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Load harness for the normalize -> parse -> build pipeline.
+
+Drives many concurrent transcript builds over a mixed corpus (synthetic
+notes plus the repository's notes/) using threads, processes or asyncio,
+and reports throughput, latency percentiles, CPU utilization and how much
+the GIL limits the thread-based mode.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from build_transcript import (
+    PRESETS,
+    RuleBasedBackend,
+    load_style_preset,
+    parse_content,
+    render_transcript,
+)
+from normalize_notes import normalize_notes
+
+
+# Constants
+MODES = ["threads", "processes", "asyncio"]
+SCRIPT_DIR = Path(__file__).resolve().parent
+RESOURCES_DIR = SCRIPT_DIR.parent / "resources"
+DEFAULT_NOTES_DIR = SCRIPT_DIR.parents[3] / "notes"
+
+WORDS = (
+    "agent model tool prompt context memory workflow retrieval embedding vector "
+    "index query response token latency cache server client protocol schema "
+    "evaluation trace graph node state message function call result error"
+).split()
+
+
+def synthetic_note(seed: int, sections: int) -> str:
+    """
+    Generate a deterministic Markdown note for load testing.
+    
+    Args:
+        seed: Random seed (same seed, same note)
+        sections: Number of H2 sections
+    
+    Returns:
+        Markdown text with headings, paragraphs, bullets and code blocks
+    """
+    rng = random.Random(seed)
+    
+    def sentence():
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 18))).capitalize() + "."
+    
+    lines = [f"# Synthetic Note {seed}", ""]
+    for i in range(1, sections + 1):
+        lines += [f"## Topic {i}: {rng.choice(WORDS).title()}", ""]
+        lines += [" ".join(sentence() for _ in range(rng.randint(2, 6))), ""]
+        
+        if rng.random() < 0.5:
+            lines += [f"- **{rng.choice(WORDS)}**: {sentence()}" for _ in range(rng.randint(2, 5))]
+            lines.append("")
+        if rng.random() < 0.3:
+            lines += ["```python", f"def step_{i}():", f"    return '{rng.choice(WORDS)}'", "```", ""]
+        if rng.random() < 0.4:
+            lines += [f"### Detail {i}.1", "", sentence(), ""]
+    
+    return "\n".join(lines)
+
+
+def load_corpus(notes_dir: Path, synthetic: int, seed: int = 0) -> list:
+    """
+    Build the mixed corpus: synthetic notes of varied size plus notes_dir.
+    
+    Returns:
+        List of (name, text) tuples
+    """
+    corpus = []
+    rng = random.Random(seed)
+    for i in range(synthetic):
+        corpus.append((f"synthetic-{i}", synthetic_note(seed + i, rng.choice([3, 8, 20, 60]))))
+    
+    if notes_dir and notes_dir.is_dir():
+        for path in sorted(notes_dir.glob("*.md")):
+            corpus.append((path.name, path.read_text(encoding="utf-8")))
+    
+    return corpus
+
+
+def run_pipeline(text: str, minutes: float, style: dict) -> int:
+    """
+    Run one normalize -> parse -> build pass.
+    
+    Returns:
+        Length of the generated transcript (keeps the work observable)
+    """
+    metadata = {}
+    normalized = normalize_notes(text, metadata)
+    content_dict = parse_content(normalized)
+    transcript, _ = render_transcript(content_dict, minutes, style, backend=RuleBasedBackend())
+    return len(transcript)
+
+
+def _run_job(job: tuple) -> int:
+    """Process-pool entry point."""
+    return run_pipeline(*job)
+
+
+def _run_measured_job(job: tuple) -> float:
+    """Process-pool entry point that returns the CPU seconds the job used."""
+    start = time.process_time()
+    run_pipeline(*job)
+    return time.process_time() - start
+
+
+def percentile(values: list, pct: float) -> float:
+    """Nearest-rank percentile of values (pct in 0-100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    # Smallest value with at least pct% of values at or below it
+    rank = math.ceil(pct * len(ordered) / 100) - 1
+    return ordered[min(max(rank, 0), len(ordered) - 1)]
+
+
+def _cpu_seconds(children: bool = True) -> float:
+    """CPU time used by this process and, optionally, its reaped children."""
+    times = os.times()
+    cpu = times.user + times.system
+    if children:
+        cpu += times.children_user + times.children_system
+    return cpu
+
+
+def _submit_all(pool, jobs: list, fn=_run_job) -> tuple:
+    """
+    Submit every job at once and record submit-to-completion latency.
+    
+    Returns:
+        (latencies, results) lists aligned with jobs
+    """
+    latencies = [0.0] * len(jobs)
+    futures = []
+    
+    for i, job in enumerate(jobs):
+        submitted = time.perf_counter()
+        future = pool.submit(fn, job)
+        
+        def record(_, i=i, submitted=submitted):
+            latencies[i] = time.perf_counter() - submitted
+        
+        future.add_done_callback(record)
+        futures.append(future)
+    
+    results = [future.result() for future in futures]
+    return latencies, results
+
+
+async def _run_asyncio_jobs(jobs: list, concurrency: int) -> list:
+    """Run jobs as coroutines, at most concurrency in flight at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    
+    async def one(job):
+        submitted = time.perf_counter()
+        async with semaphore:
+            await loop.run_in_executor(executor, _run_job, job)
+        return time.perf_counter() - submitted
+    
+    try:
+        return await asyncio.gather(*(one(job) for job in jobs))
+    finally:
+        executor.shutdown()
+
+
+def run_mode(mode: str, jobs: list, concurrency: int) -> dict:
+    """
+    Drive all jobs through one execution model and measure it.
+    
+    Pools are warmed with one job per worker before the clock starts, so
+    process start-up is not counted. Worker processes report the CPU time
+    of each measured job themselves: os.times() only sees child CPU once
+    the pool shuts down, which would also count the warm-up. Latency runs
+    from submission to completion and therefore includes queueing behind
+    other requests.
+    
+    Args:
+        mode: serial, threads, processes or asyncio
+        jobs: List of (text, minutes, style) tuples
+        concurrency: Workers / in-flight requests
+    
+    Returns:
+        Dict with throughput, latency percentiles and CPU utilization
+    """
+    worker_cpu = 0.0
+    if mode == "threads":
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        list(pool.map(_run_job, jobs[:concurrency]))
+        
+        cpu_start = _cpu_seconds()
+        wall_start = time.perf_counter()
+        latencies, _ = _submit_all(pool, jobs)
+        wall = time.perf_counter() - wall_start
+        pool.shutdown()
+    elif mode == "processes":
+        with ProcessPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(_run_job, jobs[:concurrency]))
+            
+            cpu_start = _cpu_seconds(children=False)
+            wall_start = time.perf_counter()
+            latencies, job_cpu = _submit_all(pool, jobs, _run_measured_job)
+            wall = time.perf_counter() - wall_start
+            worker_cpu = sum(job_cpu)
+    else:
+        cpu_start = _cpu_seconds()
+        wall_start = time.perf_counter()
+        
+        if mode == "serial":
+            latencies = []
+            for job in jobs:
+                start = time.perf_counter()
+                _run_job(job)
+                latencies.append(time.perf_counter() - start)
+        elif mode == "asyncio":
+            latencies = asyncio.run(_run_asyncio_jobs(jobs, concurrency))
+        else:
+            raise ValueError(f"Unknown mode: {mode}")
+        
+        wall = time.perf_counter() - wall_start
+    
+    cpu = _cpu_seconds(children=mode != "processes") - cpu_start + worker_cpu
+    cpus = os.cpu_count() or 1
+    
+    return {
+        "mode": mode,
+        "concurrency": 1 if mode == "serial" else concurrency,
+        "requests": len(jobs),
+        "wall_seconds": round(wall, 3),
+        "throughput_rps": round(len(jobs) / wall, 2) if wall else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "cpu_utilization": round(min(cpu / (wall * cpus), 1.0), 3) if wall else 0.0,
+    }
+
+
+def run_load_test(
+    corpus: list,
+    requests: int,
+    concurrency_levels: list,
+    modes: list,
+    minutes: float = 6.0,
+    preset: str = "neutral",
+    seed: int = 0,
+) -> dict:
+    """
+    Run the load test for every mode and concurrency level.
+    
+    Requests are drawn from the corpus with a fixed seed so every mode
+    sees the same workload. A serial run provides the baseline for the
+    GIL efficiency of thread-based modes: speedup over serial divided by
+    the ideal speedup min(concurrency, CPUs).
+    
+    Returns:
+        Dict with the serial baseline and one result per mode/concurrency
+    """
+    style = load_style_preset(preset, RESOURCES_DIR)
+    rng = random.Random(seed)
+    jobs = [(rng.choice(corpus)[1], minutes, style) for _ in range(requests)]
+    cpus = os.cpu_count() or 1
+    
+    baseline = run_mode("serial", jobs, 1)
+    results = []
+    
+    for concurrency in concurrency_levels:
+        for mode in modes:
+            result = run_mode(mode, jobs, concurrency)
+            speedup = baseline["wall_seconds"] / result["wall_seconds"] if result["wall_seconds"] else 0.0
+            result["speedup"] = round(speedup, 2)
+            result["parallel_efficiency"] = round(speedup / min(concurrency, cpus), 3)
+            results.append(result)
+    
+    return {"cpus": cpus, "corpus_size": len(corpus), "baseline": baseline, "results": results}
+
+
+def print_report(report: dict):
+    """Print load test results as a table."""
+    print(f"\nCPUs: {report['cpus']}  Corpus: {report['corpus_size']} documents")
+    header = f"{'mode':<10} {'conc':>4} {'rps':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'cpu':>6} {'speedup':>8} {'eff':>6}"
+    print(header)
+    print("-" * len(header))
+    
+    for result in [report["baseline"]] + report["results"]:
+        print(
+            f"{result['mode']:<10} {result['concurrency']:>4} {result['throughput_rps']:>8.1f} "
+            f"{result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} {result['p99_ms']:>9.1f} "
+            f"{result['cpu_utilization']:>6.0%} {result.get('speedup', 1.0):>8.2f} "
+            f"{result.get('parallel_efficiency', 1.0):>6.0%}"
+        )
+    
+    # Thread modes share one interpreter; low efficiency there is the GIL
+    threads = [r for r in report["results"] if r["mode"] in ("threads", "asyncio")]
+    processes = [r for r in report["results"] if r["mode"] == "processes"]
+    if threads and processes:
+        best_threads = max(r["throughput_rps"] for r in threads)
+        best_processes = max(r["throughput_rps"] for r in processes)
+        print(f"\nBest thread-based throughput: {best_threads:.1f} rps")
+        print(f"Best process-based throughput: {best_processes:.1f} rps")
+        if best_processes > best_threads:
+            print(f"GIL limits thread-based modes to {best_threads / best_processes:.0%} of process throughput")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Load test the normalize -> parse -> build pipeline"
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        default=200,
+        help="Requests per mode and concurrency level (default: 200)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=str,
+        default="1,4,8",
+        help="Comma-separated concurrency levels (default: 1,4,8)"
+    )
+    parser.add_argument(
+        "--modes",
+        type=str,
+        default=",".join(MODES),
+        help=f"Comma-separated execution models (default: {','.join(MODES)})"
+    )
+    parser.add_argument(
+        "--synthetic",
+        type=int,
+        default=20,
+        help="Synthetic notes to add to the corpus (default: 20)"
+    )
+    parser.add_argument(
+        "--notes-dir",
+        type=str,
+        default=str(DEFAULT_NOTES_DIR),
+        help="Directory of real notes to include (default: repository notes/)"
+    )
+    parser.add_argument(
+        "--minutes",
+        type=float,
+        default=6.0,
+        help="Target duration per transcript (default: 6.0)"
+    )
+    parser.add_argument(
+        "--preset",
+        type=str,
+        default="neutral",
+        choices=PRESETS,
+        help="Style preset to use (default: neutral)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for the synthetic corpus and request mix (default: 0)"
+    )
+    parser.add_argument(
+        "--json",
+        type=str,
+        help="Optional: write the full report as JSON to this path"
+    )
+    
+    args = parser.parse_args()
+    
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        print(f"Error: Unknown mode(s): {', '.join(unknown)}")
+        sys.exit(1)
+    
+    try:
+        concurrency_levels = [int(level) for level in args.concurrency.split(",")]
+    except ValueError:
+        print(f"Error: Invalid concurrency levels: {args.concurrency}")
+        sys.exit(1)
+    
+    corpus = load_corpus(Path(args.notes_dir), args.synthetic, args.seed)
+    if not corpus:
+        print("Error: Corpus is empty")
+        sys.exit(1)
+    
+    print(f"Load testing {args.requests} requests per run...")
+    report = run_load_test(
+        corpus, args.requests, concurrency_levels, modes, args.minutes, args.preset, args.seed
+    )
+    print_report(report)
+    
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"\n✓ Report saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,38 +7,165 @@ code blocks, and key information.
 """
 
 import argparse
+import hashlib
+import json
 import re
 import sys
 from pathlib import Path
 
 
-def normalize_notes(input_text: str) -> str:
+FENCE = "```"
+SIDECAR_VERSION = 1
+
+# CJK ideographs, kana and hangul are spoken one character at a time
+CJK_CHARS = "\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\uac00-\ud7af"
+CJK_RE = re.compile(f"[{CJK_CHARS}]")
+TOKEN_RE = re.compile(f"[{CJK_CHARS}]|[^\\s{CJK_CHARS}]+")
+# Runs without a letter or digit (list markers, punctuation, emoji, CJK and
+# full-width symbols) are not spoken
+UNSPOKEN_CHARS = "\u3000-\u303f\uff00-\uffef"
+ASCII_SYMBOLS_RE = re.compile(r"(?<!\S)[^\sA-Za-z0-9]+(?!\S)")
+CHUNK_RE = re.compile(f"[^\\s{CJK_CHARS}]+")
+SPOKEN_RE = re.compile(f"[^\\W_{CJK_CHARS}{UNSPOKEN_CHARS}]")
+
+
+def count_tokens(text: str) -> tuple:
     """
-    Normalize Markdown content for transcript processing.
+    Count spoken tokens in text.
     
-    Args:
-        input_text: Raw Markdown content
+    Whitespace-separated words count once each; CJK characters count
+    individually since Chinese and Japanese are not space-delimited.
+    Runs without a letter or digit (list markers, punctuation, emoji,
+    full-width symbols) are not words. ASCII text takes a split() fast
+    path.
     
     Returns:
-        Normalized Markdown text
+        (words, cjk_chars) tuple; words excludes the CJK characters
+    """
+    if text.isascii():
+        return len(text.split()) - len(ASCII_SYMBOLS_RE.findall(text)), 0
+    
+    words = sum(1 for chunk in CHUNK_RE.findall(text) if SPOKEN_RE.search(chunk))
+    return words, len(CJK_RE.findall(text))
+
+
+def find_code_spans(text: str) -> list:
+    """
+    Index fenced code blocks in a single linear pass.
+    
+    Fences are detected the same way normalize_notes() tracks them: any
+    line whose stripped form starts with ``` opens or closes a block.
+    An unterminated fence runs to the end of the text.
+    
+    Returns:
+        Sorted list of (start, end, language) tuples. Offsets cover the
+        fence lines themselves; end is exclusive.
+    """
+    spans = []
+    open_start = None
+    language = ""
+    pos = 0
+    
+    for line in text.split("\n"):
+        line_end = pos + len(line)
+        stripped = line.strip()
+        
+        if stripped.startswith(FENCE):
+            if open_start is None:
+                open_start = pos
+                language = stripped[len(FENCE):].strip()
+            else:
+                spans.append((open_start, line_end, language))
+                open_start = None
+        
+        pos = line_end + 1
+    
+    if open_start is not None:
+        spans.append((open_start, len(text), language))
+    
+    return spans
+
+
+def iter_lines(text: str, code_spans: list):
+    """
+    Walk text line by line alongside its code span index.
+    
+    Yields:
+        (line_start, line, span) tuples where span is the enclosing code
+        span or None for prose lines
+    """
+    span_idx = 0
+    pos = 0
+    
+    for line in text.split("\n"):
+        while span_idx < len(code_spans) and code_spans[span_idx][1] <= pos:
+            span_idx += 1
+        
+        span = None
+        if span_idx < len(code_spans) and code_spans[span_idx][0] <= pos:
+            span = code_spans[span_idx]
+        
+        yield pos, line, span
+        pos += len(line) + 1
+
+
+def strip_code_spans(text: str, code_spans: list, replacement: str = "") -> str:
+    """Replace every indexed code span in text with replacement."""
+    if not code_spans:
+        return text
+    
+    pieces = []
+    last = 0
+    for start, end, _ in code_spans:
+        pieces.append(text[last:start])
+        pieces.append(replacement)
+        last = end
+    pieces.append(text[last:])
+    
+    return "".join(pieces)
+
+
+def count_words(text: str, code_spans: list = None) -> int:
+    """Count spoken words (CJK characters included) in text, ignoring fenced code."""
+    if code_spans is None:
+        code_spans = find_code_spans(text)
+    return sum(count_tokens(strip_code_spans(text, code_spans)))
+
+
+def normalize_lines(lines):
+    """
+    Normalize Markdown line by line.
+    
+    Only one line of look-back is needed, so lines may come from any
+    iterable (a list, a file, a stream of extracted pages).
+    
+    Args:
+        lines: Iterable of raw Markdown lines (without newlines)
+    
+    Yields:
+        Normalized lines, before the final blank-line cleanup done by
+        normalize_notes()
     """
-    lines = input_text.split("\n")
-    normalized = []
     in_code_block = False
     skip_until_blank = False
+    prev_line = None
+    last = None
     
-    for i, line in enumerate(lines):
+    for line in lines:
+        before, prev_line = prev_line, line
         stripped = line.strip()
         
         # Track code blocks (preserve them)
-        if stripped.startswith("```"):
+        if stripped.startswith(FENCE):
             in_code_block = not in_code_block
-            normalized.append(line)
+            last = line
+            yield line
             continue
         
         # Preserve code block content as-is
         if in_code_block:
-            normalized.append(line)
+            last = line
+            yield line
             continue
         
         # Remove table of contents patterns
@@ -53,9 +180,8 @@ def normalize_notes(input_text: str) -> str:
             continue
         
         # Remove horizontal rules (keep page breaks from PDF)
-        if stripped == "---" and i > 0:
-            prev_line = lines[i-1].strip()
-            if not prev_line.startswith("<!--"):
+        if stripped == "---" and before is not None:
+            if not before.strip().startswith("<!--"):
                 continue
         
         # Remove reference-only links at end of document
@@ -69,16 +195,18 @@ def normalize_notes(input_text: str) -> str:
         # Preserve headings
         if stripped.startswith("#"):
             # Ensure proper spacing around headings
-            if normalized and normalized[-1].strip():
-                normalized.append("")
-            normalized.append(line)
-            normalized.append("")
+            if last is not None and last.strip():
+                yield ""
+            yield line
+            last = ""
+            yield ""
             continue
         
         # Skip multiple consecutive blank lines
         if not stripped:
-            if not normalized or normalized[-1].strip():
-                normalized.append("")
+            if last is None or last.strip():
+                last = ""
+                yield ""
             continue
         
         # Convert bullet points to paragraphs when they're definition-like
@@ -87,17 +215,163 @@ def normalize_notes(input_text: str) -> str:
             content = bullet_match.group(1)
             # Keep as bullet if short
             if len(content) < 100:
-                normalized.append(line)
+                last = line
             else:
                 # Convert long bullets to paragraphs
-                normalized.append(content)
+                last = content
+            yield last
             continue
         
         # Preserve other content
-        normalized.append(line)
+        last = line
+        yield line
+
+
+def track_metadata(lines, metadata: dict):
+    """
+    Pass normalized lines through while gathering metadata.
+    
+    Mirrors the section rules of build_transcript.parse_content() (first
+    H1 is the title and closes any section before it, text after the title
+    attaches to the first section) so the result can stand in for a
+    re-parse. The first non-blank line is read without its indent, as
+    join_normalized() leaves it.
+    
+    Args:
+        lines: Iterable of normalized lines
+        metadata: Dict to fill in place; complete once lines is exhausted
+    
+    Yields:
+        The input lines, unchanged
+    """
+    title = None
+    headings = []
+    sections = []
+    pages = []
+    path = []
+    current = None
+    buffer_words = 0
+    buffer_code_blocks = 0
+    total_words = 0
+    total_code_blocks = 0
+    in_code_block = False
+    started = False
     
+    for line in lines:
+        yield line
+        stripped = line.strip()
+        
+        # join_normalized() strips the text, un-indenting the first line
+        if stripped and not started:
+            line = line.lstrip()
+            started = True
+        
+        if stripped.startswith(FENCE):
+            if not in_code_block:
+                total_code_blocks += 1
+                if current or title:
+                    buffer_code_blocks += 1
+            in_code_block = not in_code_block
+            continue
+        
+        if in_code_block:
+            continue
+        
+        words = sum(count_tokens(line))
+        total_words += words
+        
+        heading_match = re.match(r"^(#{1,6})\s+(.+)$", line)
+        if heading_match:
+            headings.append(line.strip("# ").strip())
+            
+            if current:
+                sections.append({
+                    **current,
+                    "word_count": buffer_words,
+                    "code_blocks": buffer_code_blocks,
+                })
+                buffer_words = 0
+                buffer_code_blocks = 0
+            
+            level = len(heading_match.group(1))
+            heading_text = heading_match.group(2).strip()
+            
+            while path and path[-1][0] >= level:
+                path.pop()
+            path.append((level, heading_text))
+            
+            if level == 1 and not title:
+                title = heading_text
+                current = None
+                continue
+            
+            current = {
+                "level": level,
+                "heading": heading_text,
+                "path": [text for _, text in path],
+            }
+            continue
+        
+        page_match = re.match(r"^<!--\s*Page\s+(\d+)\s*-->$", stripped)
+        if page_match:
+            pages.append({
+                "page": int(page_match.group(1)),
+                "section": len(sections) if current else None,
+            })
+        
+        if current or title:
+            buffer_words += words
+    
+    if current:
+        sections.append({
+            **current,
+            "word_count": buffer_words,
+            "code_blocks": buffer_code_blocks,
+        })
+    
+    metadata.update({
+        "title": title or "Untitled Video",
+        "heading_count": len(headings),
+        "word_count": total_words,
+        "has_code": 2 * total_code_blocks - in_code_block >= 2,
+        "code_blocks": total_code_blocks,
+        "headings": headings,
+        "sections": sections,
+        "pages": pages,
+    })
+
+
+def normalize_notes(input_text: str, metadata: dict = None) -> str:
+    """
+    Normalize Markdown content for transcript processing.
+    
+    Args:
+        input_text: Raw Markdown content
+        metadata: Optional dict filled with heading, word and code-block
+            statistics gathered while normalizing (see track_metadata())
+    
+    Returns:
+        Normalized Markdown text
+    """
+    lines = normalize_lines(input_text.split("\n"))
+    if metadata is not None:
+        lines = track_metadata(lines, metadata)
+    
+    return join_normalized(lines)
+
+
+def join_normalized(lines) -> str:
+    """
+    Join normalized lines into the final text.
+    
+    Args:
+        lines: Iterable of lines from normalize_lines()
+    
+    Returns:
+        Normalized Markdown text
+    """
     # Join and clean up extra whitespace
-    result = "\n".join(normalized)
+    result = "\n".join(lines)
     
     # Remove more than 2 consecutive newlines
     result = re.sub(r"\n{3,}", "\n\n", result)
@@ -108,30 +382,90 @@ def normalize_notes(input_text: str) -> str:
     return result.strip() + "\n"
 
 
-def extract_metadata(text: str) -> dict:
+def extract_metadata(text: str, code_spans: list = None) -> dict:
     """
     Extract metadata from normalized notes.
     
+    Args:
+        text: Normalized Markdown content
+        code_spans: Optional precomputed index from find_code_spans()
+    
     Returns dict with:
         - heading_count: number of headings
         - word_count: approximate words
         - has_code: whether code blocks present
     """
-    headings = re.findall(r"^#{1,6}\s+.+$", text, re.MULTILINE)
-    code_blocks = re.findall(r"```", text)
+    if code_spans is None:
+        code_spans = find_code_spans(text)
     
-    # Remove code blocks and count words
-    text_without_code = re.sub(r"```[\s\S]*?```", "", text)
-    words = len(text_without_code.split())
+    # Headings inside fenced code (e.g. shell comments) are not headings
+    headings = [
+        line for _, line, span in iter_lines(text, code_spans)
+        if span is None and re.match(r"^#{1,6}\s+.+$", line)
+    ]
     
     return {
         "heading_count": len(headings),
-        "word_count": words,
-        "has_code": len(code_blocks) >= 2,
+        "word_count": count_words(text, code_spans),
+        # A lone unterminated fence is not a code block
+        "has_code": text.count(FENCE) >= 2,
         "headings": [h.strip("# ").strip() for h in headings]
     }
 
 
+def sidecar_path(normalized_path: Path) -> Path:
+    """Return the metadata sidecar path for a normalized file."""
+    return normalized_path.with_suffix(".meta.json")
+
+
+def write_metadata_sidecar(normalized_path: Path, normalized_text: str, metadata: dict) -> Path:
+    """
+    Write metadata as JSON next to the normalized file.
+    
+    The sidecar records a hash of the normalized text so consumers can
+    tell whether it still describes the file on disk.
+    
+    Returns:
+        Path of the written sidecar
+    """
+    path = sidecar_path(normalized_path)
+    payload = {
+        "version": SIDECAR_VERSION,
+        "sha256": hashlib.sha256(normalized_text.encode("utf-8")).hexdigest(),
+        **metadata,
+    }
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
+
+
+def load_metadata_sidecar(normalized_path: Path, normalized_text: str):
+    """
+    Load the metadata sidecar for a normalized file if it is fresh.
+    
+    Args:
+        normalized_path: Path of the normalized Markdown file
+        normalized_text: Current contents of that file
+    
+    Returns:
+        Metadata dict, or None if the sidecar is missing, unreadable or
+        was written for different content
+    """
+    path = sidecar_path(normalized_path)
+    if not path.exists():
+        return None
+    
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    
+    digest = hashlib.sha256(normalized_text.encode("utf-8")).hexdigest()
+    if payload.get("version") != SIDECAR_VERSION or payload.get("sha256") != digest:
+        return None
+    
+    return payload
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Normalize Markdown notes for transcript generation"
@@ -170,18 +504,20 @@ def main():
         print("Error: File encoding is not UTF-8")
         sys.exit(1)
     
-    normalized_text = normalize_notes(input_text)
+    metadata = {}
+    normalized_text = normalize_notes(input_text, metadata)
     
     # Write output
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(normalized_text, encoding="utf-8")
+    meta_path = write_metadata_sidecar(output_path, normalized_text, metadata)
     
     print(f"✓ Normalized content saved to: {output_path}")
+    print(f"✓ Metadata saved to: {meta_path}")
     
     # Show metadata if requested
     if args.metadata:
-        metadata = extract_metadata(normalized_text)
         print(f"\nMetadata:")
         print(f"  Headings: {metadata['heading_count']}")
         print(f"  Words: {metadata['word_count']}")
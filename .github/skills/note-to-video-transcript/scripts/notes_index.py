@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Maintain a SQLite index of the notes corpus.
+
+The index stores per-file hashes, heading trees, section word counts,
+code presence and the transcripts generated from each note, so batch
+jobs can pick inputs with a query instead of re-reading and re-parsing
+every Markdown file. Updates are incremental: unchanged files are
+skipped by size/mtime and then by content hash.
+"""
+
+import argparse
+import hashlib
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from build_transcript import parse_content
+from normalize_notes import extract_metadata, normalize_notes
+
+
+# Constants
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[3]
+DEFAULT_DB = ".tmp/notes_index.sqlite"
+DEFAULT_ROOTS = [REPO_ROOT / "notes", REPO_ROOT / "days"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    title TEXT,
+    heading_count INTEGER,
+    word_count INTEGER,
+    has_code INTEGER,
+    headings TEXT,
+    indexed_at REAL
+);
+CREATE TABLE IF NOT EXISTS sections (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    level INTEGER NOT NULL,
+    heading TEXT NOT NULL,
+    heading_path TEXT NOT NULL,
+    section_id TEXT,
+    content_hash TEXT,
+    word_count INTEGER NOT NULL,
+    has_code INTEGER NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sections_file ON sections(file_id);
+CREATE INDEX IF NOT EXISTS sections_words ON sections(word_count);
+CREATE TABLE IF NOT EXISTS transcripts (
+    id INTEGER PRIMARY KEY,
+    file_id INTEGER NOT NULL REFERENCES files(id) ON DELETE CASCADE,
+    output_path TEXT NOT NULL,
+    preset TEXT,
+    target_minutes REAL,
+    total_words INTEGER,
+    total_minutes REAL,
+    created_at REAL NOT NULL,
+    content TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS transcripts_file ON transcripts(file_id);
+"""
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    """
+    Open (and if needed create) the index database.
+    
+    A full-text table over section headings and content is created when
+    SQLite has FTS5; queries fall back to LIKE otherwise.
+    """
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.executescript(SCHEMA)
+    
+    try:
+        conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS sections_fts USING fts5(heading, content)"
+        )
+    except sqlite3.OperationalError:
+        pass
+    
+    return conn
+
+
+def has_fts(conn: sqlite3.Connection) -> bool:
+    """Check whether the full-text table is available."""
+    row = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sections_fts'"
+    ).fetchone()
+    return row is not None
+
+
+def _delete_file(conn: sqlite3.Connection, file_id: int, fts: bool):
+    if fts:
+        conn.execute(
+            "DELETE FROM sections_fts WHERE rowid IN (SELECT id FROM sections WHERE file_id = ?)",
+            (file_id,),
+        )
+    conn.execute("DELETE FROM sections WHERE file_id = ?", (file_id,))
+
+
+def index_file(conn: sqlite3.Connection, path: Path, text: str, stat, digest: str, fts: bool):
+    """
+    (Re)index one file from parse_content() and extract_metadata() output.
+    """
+    normalized = normalize_notes(text)
+    content_dict = parse_content(normalized)
+    metadata = extract_metadata(normalized, content_dict["code_spans"])
+    
+    row = conn.execute("SELECT id FROM files WHERE path = ?", (str(path),)).fetchone()
+    values = (
+        digest,
+        stat.st_size,
+        stat.st_mtime,
+        content_dict["title"],
+        metadata["heading_count"],
+        metadata["word_count"],
+        int(metadata["has_code"]),
+        json.dumps(metadata["headings"], ensure_ascii=False),
+        time.time(),
+    )
+    
+    if row:
+        file_id = row["id"]
+        _delete_file(conn, file_id, fts)
+        conn.execute(
+            "UPDATE files SET sha256 = ?, size = ?, mtime = ?, title = ?, heading_count = ?, "
+            "word_count = ?, has_code = ?, headings = ?, indexed_at = ? WHERE id = ?",
+            values + (file_id,),
+        )
+    else:
+        cursor = conn.execute(
+            "INSERT INTO files (sha256, size, mtime, title, heading_count, word_count, "
+            "has_code, headings, indexed_at, path) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            values + (str(path),),
+        )
+        file_id = cursor.lastrowid
+    
+    for position, section in enumerate(content_dict["sections"]):
+        cursor = conn.execute(
+            "INSERT INTO sections (file_id, position, level, heading, heading_path, section_id, "
+            "content_hash, word_count, has_code, content) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                file_id,
+                position,
+                section["level"],
+                section["heading"],
+                " > ".join(section["path"]),
+                section["section_id"],
+                section["content_hash"],
+                section["word_count"],
+                int(bool(section["code_spans"])),
+                section["content"],
+            ),
+        )
+        if fts:
+            conn.execute(
+                "INSERT INTO sections_fts (rowid, heading, content) VALUES (?, ?, ?)",
+                (cursor.lastrowid, section["heading"], section["content"]),
+            )
+
+
+def update_index(conn: sqlite3.Connection, roots: list) -> dict:
+    """
+    Bring the index up to date with the Markdown files under roots.
+    
+    Files whose size and mtime are unchanged are skipped without being
+    read; files that were touched but hash the same only get their stat
+    refreshed. Files that disappeared are removed.
+    
+    Returns:
+        Dict with added, updated, unchanged and removed counts
+    """
+    fts = has_fts(conn)
+    stats = {"added": 0, "updated": 0, "unchanged": 0, "removed": 0}
+    known = {
+        row["path"]: row
+        for row in conn.execute("SELECT id, path, sha256, size, mtime FROM files")
+    }
+    seen = set()
+    
+    with conn:
+        for root in roots:
+            root = Path(root)
+            paths = [root] if root.is_file() else sorted(root.rglob("*.md"))
+            
+            for path in paths:
+                path = path.resolve()
+                seen.add(str(path))
+                stat = path.stat()
+                row = known.get(str(path))
+                
+                if row and row["size"] == stat.st_size and row["mtime"] == stat.st_mtime:
+                    stats["unchanged"] += 1
+                    continue
+                
+                try:
+                    text = path.read_text(encoding="utf-8")
+                except UnicodeDecodeError:
+                    print(f"Warning: Skipping non-UTF-8 file: {path}")
+                    continue
+                
+                digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+                if row and row["sha256"] == digest:
+                    conn.execute(
+                        "UPDATE files SET size = ?, mtime = ? WHERE id = ?",
+                        (stat.st_size, stat.st_mtime, row["id"]),
+                    )
+                    stats["unchanged"] += 1
+                    continue
+                
+                index_file(conn, path, text, stat, digest, fts)
+                stats["updated" if row else "added"] += 1
+        
+        root_prefixes = [str(Path(root).resolve()) for root in roots]
+        for path, row in known.items():
+            under_root = any(path == prefix or path.startswith(prefix + "/") for prefix in root_prefixes)
+            if under_root and path not in seen:
+                _delete_file(conn, row["id"], fts)
+                conn.execute("DELETE FROM files WHERE id = ?", (row["id"],))
+                stats["removed"] += 1
+    
+    return stats
+
+
+def query_sections(
+    conn: sqlite3.Connection,
+    mention: str = None,
+    max_words: int = None,
+    min_words: int = None,
+    has_code: bool = None,
+    limit: int = 50,
+) -> list:
+    """
+    Find sections by topic, size and code presence.
+    
+    Args:
+        mention: Text the heading or content must contain
+        max_words: Largest section word count
+        min_words: Smallest section word count
+        has_code: Require (True) or exclude (False) fenced code
+        limit: Maximum rows returned
+    
+    Returns:
+        List of dicts with file path, title, heading path and word count
+    """
+    clauses = []
+    params = []
+    join = ""
+    
+    if mention:
+        if has_fts(conn):
+            join = "JOIN sections_fts ON sections_fts.rowid = s.id"
+            clauses.append("sections_fts MATCH ?")
+            params.append('"' + mention.replace('"', '""') + '"')
+        else:
+            clauses.append("(s.heading LIKE ? OR s.content LIKE ?)")
+            params += [f"%{mention}%", f"%{mention}%"]
+    if max_words is not None:
+        clauses.append("s.word_count <= ?")
+        params.append(max_words)
+    if min_words is not None:
+        clauses.append("s.word_count >= ?")
+        params.append(min_words)
+    if has_code is not None:
+        clauses.append("s.has_code = ?")
+        params.append(int(has_code))
+    
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    rows = conn.execute(
+        f"SELECT f.path, f.title, s.heading, s.heading_path, s.word_count, s.has_code "
+        f"FROM sections s JOIN files f ON f.id = s.file_id {join} {where} "
+        f"ORDER BY f.path, s.position LIMIT ?",
+        params + [limit],
+    ).fetchall()
+    
+    return [dict(row) for row in rows]
+
+
+def record_transcript(conn: sqlite3.Connection, note_path: Path, transcript_path: Path, summary: dict = None) -> int:
+    """
+    Store a generated transcript against the note it came from.
+    
+    The note must already be indexed. summary is the dict written by
+    build_transcript.py next to the transcript, if available.
+    
+    Returns:
+        Row id of the stored transcript
+    """
+    row = conn.execute("SELECT id FROM files WHERE path = ?", (str(note_path.resolve()),)).fetchone()
+    if row is None:
+        raise ValueError(f"Note is not indexed: {note_path}")
+    
+    summary = summary or {}
+    with conn:
+        cursor = conn.execute(
+            "INSERT INTO transcripts (file_id, output_path, preset, target_minutes, total_words, "
+            "total_minutes, created_at, content) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                row["id"],
+                str(transcript_path.resolve()),
+                summary.get("preset"),
+                summary.get("target_minutes"),
+                summary.get("total_words"),
+                summary.get("total_minutes"),
+                time.time(),
+                transcript_path.read_text(encoding="utf-8"),
+            ),
+        )
+    return cursor.lastrowid
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Maintain and query a SQLite index of the notes corpus"
+    )
+    parser.add_argument(
+        "--db",
+        type=str,
+        default=DEFAULT_DB,
+        help=f"Path to the index database (default: {DEFAULT_DB})"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    update_parser = subparsers.add_parser("update", help="Index new and changed notes")
+    update_parser.add_argument(
+        "roots",
+        nargs="*",
+        type=str,
+        help="Files or directories to index (default: repository notes/ and days/)"
+    )
+    
+    query_parser = subparsers.add_parser("query", help="Find sections")
+    query_parser.add_argument("--mention", type=str, help="Text the section must mention")
+    query_parser.add_argument("--max-words", type=int, help="Largest section word count")
+    query_parser.add_argument("--min-words", type=int, help="Smallest section word count")
+    code_group = query_parser.add_mutually_exclusive_group()
+    code_group.add_argument(
+        "--has-code", dest="has_code", action="store_const", const=True, help="Only sections with code"
+    )
+    code_group.add_argument(
+        "--no-code", dest="has_code", action="store_const", const=False, help="Only sections without code"
+    )
+    query_parser.add_argument("--limit", type=int, default=50, help="Maximum results (default: 50)")
+    query_parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    
+    transcript_parser = subparsers.add_parser("add-transcript", help="Record a generated transcript")
+    transcript_parser.add_argument("note", type=str, help="Source note the transcript was built from")
+    transcript_parser.add_argument("transcript", type=str, help="Generated transcript file")
+    
+    args = parser.parse_args()
+    conn = connect(Path(args.db))
+    
+    if args.command == "update":
+        roots = [Path(root) for root in args.roots] or [root for root in DEFAULT_ROOTS if root.exists()]
+        missing = [root for root in roots if not root.exists()]
+        if missing:
+            print(f"Error: Path does not exist: {missing[0]}")
+            sys.exit(1)
+        
+        start = time.perf_counter()
+        stats = update_index(conn, roots)
+        elapsed = time.perf_counter() - start
+        print(f"✓ Index updated in {elapsed * 1000:.0f} ms: {stats['added']} added, "
+              f"{stats['updated']} updated, {stats['unchanged']} unchanged, {stats['removed']} removed")
+    
+    elif args.command == "query":
+        results = query_sections(
+            conn, args.mention, args.max_words, args.min_words, args.has_code, args.limit
+        )
+        if args.json:
+            print(json.dumps(results, indent=2, ensure_ascii=False))
+        else:
+            for result in results:
+                print(f"{Path(result['path']).name}: {result['heading_path']} ({result['word_count']} words)")
+            print(f"\n{len(results)} section(s)")
+    
+    elif args.command == "add-transcript":
+        transcript_path = Path(args.transcript)
+        if not transcript_path.exists():
+            print(f"Error: Transcript does not exist: {transcript_path}")
+            sys.exit(1)
+        
+        summary_file = transcript_path.with_suffix(".summary.json")
+        summary = json.loads(summary_file.read_text(encoding="utf-8")) if summary_file.exists() else None
+        
+        try:
+            record_transcript(conn, Path(args.note), transcript_path, summary)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        print(f"✓ Recorded transcript for {Path(args.note).name}")
+    
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+"""
+Compiled templates for transcript layout and style phrases.
+
+The transcript layout lives in resources/transcript-template.md and each
+style preset's settings and phrases live in a JSON block inside its
+resources/style-presets/<name>.md file. Templates are parsed and
+validated once and rendered with str.format_map, so a transcript is
+rendered as a list of block strings and a single join, with no per-call
+branching.
+Compiled layouts and presets are cached by file mtime, so edits are
+picked up without restarting long-running batch jobs.
+
+Run as a script to validate the layout and every preset:
+
+    python scripts/transcript_templates.py
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import string
+import sys
+from pathlib import Path
+
+
+# Constants
+RESOURCES_DIR = Path(__file__).resolve().parent.parent / "resources"
+DEFAULT_TEMPLATE = RESOURCES_DIR / "transcript-template.md"
+# Block or phrase name -> the fields it is rendered with
+LAYOUT_BLOCKS = {
+    "header": ("title", "target_minutes", "target_words", "preset", "generated"),
+    "block": ("heading", "text", "duration", "label"),
+    "notes": ("total_minutes", "total_words"),
+    "coverage_item": ("heading",),
+    "degradations": ("deadline_ms", "degradations"),
+}
+PHRASE_KEYS = {
+    "hook": ("title", "title_lower", "topics"),
+    "intro": ("title", "title_lower", "topics"),
+    "section": ("heading", "body"),
+    "recap": ("items",),
+    "recap_item": ("heading",),
+    "cta": (),
+}
+
+BLOCK_RE = re.compile(r"^<!-- block: ([a-z_]+) -->\n", re.MULTILINE)
+JSON_BLOCK_RE = re.compile(r"^```json\n(.*?)^```", re.MULTILINE | re.DOTALL)
+
+_layout_cache = {}  # path -> (mtime_ns, blocks)
+_preset_cache = {}  # path -> (mtime_ns, config)
+_phrase_cache = {}  # template text -> render function
+
+
+def compile_template(text: str, name: str = "template", fields: tuple = None):
+    """
+    Compile a template string into a render function.
+    
+    Placeholders use str.format syntax restricted to plain field names:
+    {field} and {field:spec}. The template is parsed and validated once;
+    the render function is the template's str.format_map.
+    
+    Args:
+        text: Template text
+        name: Name used in error messages
+        fields: Field names the template is rendered with (None allows any)
+    
+    Returns:
+        Function mapping a values dict to the rendered string
+    
+    Raises:
+        ValueError: If a placeholder is malformed, uses attribute, index,
+            conversion or nested-field syntax, or names an unknown field
+    """
+    try:
+        parsed = list(string.Formatter().parse(text))
+    except ValueError as e:
+        raise ValueError(f"Invalid template {name}: {e}") from e
+    
+    for _, field, spec, conversion in parsed:
+        if field is None:
+            continue
+        if not field.isidentifier() or conversion or "{" in spec:
+            raise ValueError(f"Unsupported placeholder in {name}: {{{field}}}")
+        if fields is not None and field not in fields:
+            allowed = ", ".join(f"{{{f}}}" for f in fields) or "none"
+            raise ValueError(f"Unknown field in {name}: {{{field}}} (allowed: {allowed})")
+    
+    return text.format_map
+
+
+def _cached(cache: dict, path: Path, loader):
+    """Return loader(path), reusing the cached result while mtime is unchanged."""
+    mtime = os.stat(path).st_mtime_ns
+    entry = cache.get(path)
+    if entry and entry[0] == mtime:
+        return entry[1]
+    
+    value = loader(Path(path))
+    cache[path] = (mtime, value)
+    return value
+
+
+def _compile_layout(path: Path) -> dict:
+    parts = BLOCK_RE.split(path.read_text(encoding="utf-8"))
+    blocks = {
+        name: compile_template(text, f"{path.name}:{name}", LAYOUT_BLOCKS.get(name))
+        for name, text in zip(parts[1::2], parts[2::2])
+    }
+    
+    missing = [name for name in LAYOUT_BLOCKS if name not in blocks]
+    if missing:
+        raise ValueError(f"Template {path} is missing blocks: {', '.join(missing)}")
+    return blocks
+
+
+def load_layout(path: Path = DEFAULT_TEMPLATE) -> dict:
+    """
+    Load the compiled transcript layout.
+    
+    Args:
+        path: Layout template file
+    
+    Returns:
+        Dict mapping block name (see LAYOUT_BLOCKS) to its render function
+
+    Raises:
+        ValueError: If a block is missing or a placeholder is invalid
+    """
+    return _cached(_layout_cache, path, _compile_layout)
+
+
+def _read_preset(path: Path) -> dict:
+    match = JSON_BLOCK_RE.search(path.read_text(encoding="utf-8"))
+    if not match:
+        raise ValueError(f"Preset {path} has no ```json settings block")
+    
+    try:
+        config = json.loads(match.group(1))
+    except ValueError as e:
+        raise ValueError(f"Preset {path} has an invalid settings block: {e}") from e
+    config["fingerprint"] = hashlib.sha256(match.group(1).encode("utf-8")).hexdigest()[:16]
+    missing = [key for key in PHRASE_KEYS if key not in config.get("phrases", {})]
+    if missing:
+        raise ValueError(f"Preset {path} is missing phrases: {', '.join(missing)}")
+    
+    # Fail on bad placeholders and unknown fields when the preset loads,
+    # not mid-render
+    for key, text in config["phrases"].items():
+        _phrase_cache[text] = compile_template(text, f"{path.stem}:{key}", PHRASE_KEYS.get(key))
+    
+    config["sentence_length"] = tuple(config.get("sentence_length", ()))
+    return config
+
+
+def load_preset_config(path: Path) -> dict:
+    """
+    Load settings and phrases from a style preset file.
+    
+    Args:
+        path: Style preset Markdown file with a ```json settings block
+    
+    Returns:
+        Dict with the preset's settings, a "phrases" dict and a
+        "fingerprint" of the settings block used in cache keys; the cached
+        dict is shared, so callers should copy it before changing it
+    """
+    return _cached(_preset_cache, path, _read_preset)
+
+
+def list_presets(resources_dir: Path = RESOURCES_DIR) -> list:
+    """Return the names of all style presets in resources_dir."""
+    return sorted(path.stem for path in (Path(resources_dir) / "style-presets").glob("*.md"))
+
+
+def compile_phrase(text: str, name: str = "phrase"):
+    """Return the compiled render function for a phrase, compiling it once."""
+    render = _phrase_cache.get(text)
+    if render is None:
+        render = _phrase_cache[text] = compile_template(text, name)
+    return render
+
+
+def render_phrase(text: str, values: dict) -> str:
+    """Render a phrase template with values."""
+    return compile_phrase(text)(values)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate the transcript layout and style preset phrases"
+    )
+    parser.add_argument(
+        "--template",
+        type=str,
+        default=str(DEFAULT_TEMPLATE),
+        help="Layout template to check (default: resources/transcript-template.md)"
+    )
+    parser.add_argument(
+        "--resources",
+        type=str,
+        default=str(RESOURCES_DIR),
+        help="Resources directory with style-presets/ (default: resources/)"
+    )
+    
+    args = parser.parse_args()
+    
+    errors = 0
+    try:
+        blocks = load_layout(Path(args.template))
+        print(f"✓ Layout: {', '.join(blocks)}")
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}")
+        errors += 1
+    
+    for name in list_presets(Path(args.resources)):
+        try:
+            config = load_preset_config(Path(args.resources) / "style-presets" / f"{name}.md")
+            print(f"✓ Preset {name}: {len(config['phrases'])} phrases")
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            errors += 1
+    
+    if errors:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for proportional word budgets.
+
+proportional_budgets() (one document) and budget_planner.plan_budgets()
+(a whole corpus with NumPy) implement the same rules and must agree.
+The corpus planner needs numpy; its tests are skipped without it.
+Run directly or with pytest:
+
+    python tests/test_budget_planner.py
+"""
+
+import importlib.util
+import random
+import sys
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+from build_transcript import (  # noqa: E402
+    FIXED_WORDS,
+    MAX_SECTION_BUDGET,
+    MIN_SECTION_BUDGET,
+    WORDS_PER_MINUTE,
+    proportional_budgets,
+)
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+if HAS_NUMPY:
+    from budget_planner import load_section_stats, plan_budgets  # noqa: E402
+
+
+def main_words(minutes: float) -> int:
+    return max(int(minutes * WORDS_PER_MINUTE) - FIXED_WORDS, 0)
+
+
+def random_documents(count: int, seed: int = 0) -> list:
+    """Documents with varied section counts, sizes and targets."""
+    rng = random.Random(seed)
+    documents = []
+    for _ in range(count):
+        sections = rng.choice([1, 2, 3, 5, 8, 20, 60])
+        words = [rng.choice([0, 1, 5, 40, 300, 2500]) + rng.randint(0, 50) for _ in range(sections)]
+        documents.append({
+            "sections": [{"heading": f"S{i}", "word_count": w} for i, w in enumerate(words)],
+            "minutes": rng.choice([1.5, 2.5, 4, 6, 8, 15, 40]),
+        })
+    return documents
+
+
+def single_budgets(doc: dict) -> list:
+    weights = [max(section["word_count"], 1) for section in doc["sections"]]
+    return proportional_budgets(weights, main_words(doc["minutes"]))
+
+
+def test_budgets_sum_to_main_words():
+    for doc in random_documents(300):
+        budgets = single_budgets(doc)
+        total = main_words(doc["minutes"])
+        if len(budgets) * MAX_SECTION_BUDGET > total:
+            assert sum(budgets) == total
+        assert max(budgets) <= MAX_SECTION_BUDGET
+
+
+def test_everything_fits_under_cap():
+    # count x max <= total: every section gets the cap
+    assert proportional_budgets([1, 50, 900], 3 * MAX_SECTION_BUDGET) == [MAX_SECTION_BUDGET] * 3
+    assert proportional_budgets([1, 50, 900], 5000) == [MAX_SECTION_BUDGET] * 3
+
+
+def test_total_below_minimums():
+    # total < count x min: the minimum drops to an equal share
+    total = 3 * MIN_SECTION_BUDGET - 1
+    budgets = proportional_budgets([1, 1, 1000], total)
+    assert sum(budgets) == total
+    assert min(budgets) >= total // 3
+    
+    assert proportional_budgets([5, 10], 0) == [0, 0]
+
+
+def test_minimum_clamp():
+    budgets = proportional_budgets([1, 1000, 1000], 600)
+    assert sum(budgets) == 600
+    assert budgets[0] == MIN_SECTION_BUDGET
+
+
+def test_vectorized_matches_single():
+    if not HAS_NUMPY:
+        print("  skipped: numpy is not installed")
+        return
+    
+    documents = random_documents(1000, seed=1)
+    documents.append({"sections": [{"heading": "S", "word_count": 10}] * 3, "minutes": 0.5})
+    documents.append({"sections": [{"heading": "S", "word_count": 10}] * 2, "minutes": 40})
+    
+    weights, mask = load_section_stats(documents)
+    budgets = plan_budgets(weights, mask, [doc["minutes"] for doc in documents])
+    
+    for row, doc in enumerate(documents):
+        vectorized = budgets[row, :len(doc["sections"])].tolist()
+        assert vectorized == single_budgets(doc), f"document {row} differs"
+        assert budgets[row, len(doc["sections"]):].sum() == 0
+
+
+def main():
+    tests = [
+        test_budgets_sum_to_main_words,
+        test_everything_fits_under_cap,
+        test_total_below_minimums,
+        test_minimum_clamp,
+        test_vectorized_matches_single,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
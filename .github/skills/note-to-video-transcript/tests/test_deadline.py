@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for deadline-aware transcript generation.
+
+A deliberately slow generation server stands in for a remote backend
+that would otherwise blow the latency budget. Run directly or with
+pytest:
+
+    python tests/test_deadline.py
+"""
+
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+sys.path.insert(0, str(SKILL_DIR / "tests"))
+
+from build_transcript import (  # noqa: E402
+    RULES_FALLBACK,
+    Deadline,
+    build_transcript,
+    load_style_preset,
+    parse_content,
+    render_transcript,
+)
+from generation_backends import HttpBackend, _StubHandler  # noqa: E402
+from test_golden_output import validate_transcript_structure  # noqa: E402
+
+
+STYLE = load_style_preset("neutral", SKILL_DIR / "resources")
+CONTENT = parse_content((SKILL_DIR / "examples" / "input_note.md").read_text(encoding="utf-8"))
+SERVER_DELAY = 2.0  # Seconds the slow server takes per call
+
+
+class _SlowHandler(_StubHandler):
+    def do_POST(self):
+        time.sleep(SERVER_DELAY)
+        super().do_POST()
+
+
+def test_slow_backend_meets_deadline():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    host, port = httpd.server_address[:2]
+    
+    try:
+        deadline = Deadline(300)
+        started = time.perf_counter()
+        transcript, summary = render_transcript(
+            CONTENT, 6, STYLE, backend=HttpBackend(f"http://{host}:{port}"), deadline=deadline
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+    
+    # Well under one server call: the backend wait is cut at the deadline
+    assert elapsed < SERVER_DELAY / 2
+    assert summary["deadline"]["degradations"][0] == RULES_FALLBACK
+    assert "headings_only" in summary["deadline"]["degradations"]
+    assert validate_transcript_structure(transcript) == []
+    assert RULES_FALLBACK in transcript
+
+
+def test_generous_deadline_changes_nothing():
+    transcript, summary = render_transcript(CONTENT, 6, STYLE, deadline=Deadline(60000))
+    plain, _ = render_transcript(CONTENT, 6, STYLE)
+    
+    assert summary["deadline"]["degradations"] == []
+    strip = lambda text: [line for line in text.splitlines() if "**Generated**" not in line]
+    assert strip(transcript) == strip(plain)
+
+
+def test_non_positive_deadline_is_rejected():
+    for deadline_ms in [0, -5]:
+        try:
+            build_transcript(CONTENT, 6, STYLE, deadline_ms=deadline_ms)
+        except ValueError:
+            continue
+        raise AssertionError(f"deadline_ms={deadline_ms} was accepted")
+
+
+def main():
+    tests = [
+        test_slow_backend_meets_deadline,
+        test_generous_deadline_changes_nothing,
+        test_non_positive_deadline_is_rejected,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
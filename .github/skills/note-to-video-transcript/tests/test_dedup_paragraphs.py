@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tests for near-duplicate paragraph removal.
+
+Run directly or with pytest:
+
+    python tests/test_dedup_paragraphs.py
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+from dedup_paragraphs import ParagraphIndex, dedup_text, index_references  # noqa: E402
+from normalize_notes import normalize_notes  # noqa: E402
+
+
+REPEATED = (
+    "The planner agent reads the task description, splits it into ordered steps, "
+    "and hands each step to a worker agent together with the relevant context, "
+    "the tools it may call, the expected output format and a strict time budget "
+    "so that slow steps never block the whole workflow."
+)
+NEW_SENTENCE = "Failed steps are retried once."
+CODE = "```python\ndef plan(task):\n    return [step for step in task.split(';') if step.strip()]\n```"
+
+NOTE = normalize_notes(f"""# Agent Workflow
+
+## Planning
+
+{REPEATED}
+
+{CODE}
+
+## Execution
+
+{REPEATED} {NEW_SENTENCE}
+
+{CODE}
+""")
+
+
+def test_drop_removes_repeat():
+    result, report = dedup_text(NOTE, mode="drop")
+    
+    assert report["duplicates"] == 1
+    assert report["words_saved"] > 0
+    assert result.count("The planner agent reads") == 1
+    assert NEW_SENTENCE not in result
+
+
+def test_merge_keeps_new_sentence():
+    result, report = dedup_text(NOTE, mode="merge")
+    
+    assert report["duplicates"] == 1
+    assert report["merged"] == 1
+    assert result.count("The planner agent reads") == 1
+    assert result.count(NEW_SENTENCE) == 1
+    # The sentence joins the first copy, under the first heading
+    assert result.index(NEW_SENTENCE) < result.index("## Execution")
+
+
+def test_fenced_code_is_never_dropped():
+    for mode in ["drop", "merge"]:
+        result, _ = dedup_text(NOTE, mode=mode)
+        assert result.count(CODE) == 2
+        assert result.count("```") == 4
+
+
+def test_dedup_against_reference():
+    note = normalize_notes(f"# Execution Notes\n\n## Steps\n\n{REPEATED}\n\n{CODE}\n")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        reference = Path(tmp) / "reference.md"
+        reference.write_text(NOTE, encoding="utf-8")
+        own_copy = Path(tmp) / "note.md"
+        own_copy.write_text(note, encoding="utf-8")
+        
+        index = ParagraphIndex()
+        # The note's own file is excluded, the other reference is indexed
+        assert index_references([reference, own_copy], index, exclude_text=note) == 1
+        result, report = dedup_text(note, index, source="note.md")
+    
+    assert report["duplicates"] == 1
+    assert report["matches"][0]["source"] == str(reference)
+    assert "The planner agent reads" not in result
+    assert CODE in result
+
+
+def test_build_transcript_dedup_against():
+    note = normalize_notes(f"# Execution Notes\n\n## Steps\n\n{REPEATED}\n\n## Review\n\nCheck each output.\n")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "note.md"
+        input_path.write_text(note, encoding="utf-8")
+        reference = Path(tmp) / "reference.md"
+        reference.write_text(NOTE, encoding="utf-8")
+        output = Path(tmp) / "transcript.md"
+        
+        subprocess.run(
+            [
+                sys.executable, str(SKILL_DIR / "scripts" / "build_transcript.py"),
+                "--input", str(input_path), "--output", str(output),
+                "--dedup-against", str(reference),
+            ],
+            check=True,
+            capture_output=True,
+        )
+        summary = json.loads(output.with_suffix(".summary.json").read_text(encoding="utf-8"))
+    
+    assert summary["dedup"]["duplicates"] == 1
+    assert summary["dedup"]["words_saved"] > 0
+
+
+def main():
+    tests = [
+        test_drop_removes_repeat,
+        test_merge_keeps_new_sentence,
+        test_fenced_code_is_never_dropped,
+        test_dedup_against_reference,
+        test_build_transcript_dedup_against,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Tests for PDF extraction.
+
+Test PDFs are generated with fpdf2. Extraction needs pdfplumber; the
+tests are skipped when either is missing. Run directly or with pytest:
+
+    python tests/test_extract_pdf_text.py
+"""
+
+import importlib.util
+import multiprocessing
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+HAS_PDF_TOOLS = all(importlib.util.find_spec(name) for name in ["pdfplumber", "fpdf", "PIL"])
+if HAS_PDF_TOOLS:
+    import pdfplumber  # noqa: E402
+    from fpdf import FPDF  # noqa: E402
+    from PIL import Image  # noqa: E402
+    
+    import extract_pdf_text as extractor  # noqa: E402
+    from extract_pdf_text import (  # noqa: E402
+        _next_page,
+        detect_scanned_pdf,
+        extract_and_normalize,
+        extract_pdf_text,
+        sample_page_indexes,
+    )
+    from normalize_notes import normalize_notes, sidecar_path, write_metadata_sidecar  # noqa: E402
+
+
+TEXT_PAGE = (
+    "Agent Workflows\n"
+    "A planner agent splits each task into ordered steps and hands every step "
+    "to a worker agent with the context and tools it needs."
+)
+
+RULED_PAGE = (
+    "# Agent Workflows\n"
+    "Each worker reports back to the planner when its step is done.\n"
+    "---\n"
+    "## Retries\n"
+    "A failed step is retried once before the planner gives up."
+)
+
+
+def make_pdf(path: Path, pages: list):
+    """Write a PDF with one page per entry: text, "" (blank) or None (image only)."""
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=12)
+    for page in pages:
+        pdf.add_page()
+        if page is None:
+            pdf.image(Image.new("RGB", (400, 300), (90, 90, 90)), x=20, y=20, w=170)
+        elif page:
+            pdf.multi_cell(0, 8, page)
+    pdf.output(str(path))
+
+
+def skipped() -> bool:
+    if not HAS_PDF_TOOLS:
+        print("  skipped: pdfplumber, fpdf2 or Pillow is not installed")
+    return not HAS_PDF_TOOLS
+
+
+def test_sample_page_indexes():
+    if skipped():
+        return
+    
+    assert sample_page_indexes(10, 0) == []
+    assert sample_page_indexes(0, 5) == []
+    assert sample_page_indexes(10, 1) == [0]
+    assert sample_page_indexes(4, 4) == [0, 1, 2, 3]
+    assert sample_page_indexes(4, 9) == [0, 1, 2, 3]
+    
+    for total in [2, 3, 7, 10, 101]:
+        for samples in range(2, total):
+            indexes = sample_page_indexes(total, samples)
+            # Evenly spread, so no duplicates collapse the sample
+            assert len(indexes) == samples
+            assert indexes[0] == 0 and indexes[-1] == total - 1
+            assert indexes == sorted(set(indexes))
+
+
+def test_image_only_pdf_is_detected():
+    if skipped():
+        return
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        scanned = Path(tmp) / "scanned.pdf"
+        make_pdf(scanned, [None] * 3)
+        text = Path(tmp) / "text.pdf"
+        make_pdf(text, [TEXT_PAGE] * 3)
+        
+        with pdfplumber.open(scanned) as pdf:
+            check = detect_scanned_pdf(pdf)
+        assert check == {"sampled": [1, 2, 3], "text_pages": [], "scanned": True}
+        
+        with pdfplumber.open(text) as pdf:
+            assert not detect_scanned_pdf(pdf)["scanned"]
+
+
+def test_full_extracts_past_image_only_samples():
+    if skipped():
+        return
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        # Only the image-only first and last pages are sampled
+        pdf_path = Path(tmp) / "scanned-cover.pdf"
+        make_pdf(pdf_path, [None, TEXT_PAGE, TEXT_PAGE, None])
+        output = Path(tmp) / "extracted.md"
+        
+        assert not extract_pdf_text(pdf_path, output, sample_pages=2)
+        assert not output.exists()
+        
+        assert extract_pdf_text(pdf_path, output, sample_pages=2, force_full=True)
+        text = output.read_text(encoding="utf-8")
+        assert text.startswith("\n\n---\n<!-- Page 2 -->")
+        assert text.count("Agent Workflows") == 2
+
+
+def test_pipeline_matches_extract_then_normalize():
+    if skipped():
+        return
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "notes.pdf"
+        make_pdf(pdf_path, [RULED_PAGE, TEXT_PAGE, "", RULED_PAGE, TEXT_PAGE])
+        
+        # The two-step path: extract_pdf_text.py, then normalize_notes.py
+        extracted = Path(tmp) / "extracted.md"
+        assert extract_pdf_text(pdf_path, extracted)
+        metadata = {}
+        expected_path = Path(tmp) / "expected.md"
+        expected_path.write_text(normalize_notes(extracted.read_text(encoding="utf-8"), metadata), encoding="utf-8")
+        write_metadata_sidecar(expected_path, expected_path.read_text(encoding="utf-8"), metadata)
+        assert "<!-- Page 4 -->" in expected_path.read_text(encoding="utf-8")
+        
+        for workers in [1, 2, 3]:
+            output = Path(tmp) / f"pipelined-{workers}.md"
+            assert extract_and_normalize(pdf_path, output, workers=workers, queue_pages=1)
+            assert output.read_bytes() == expected_path.read_bytes(), f"{workers} workers"
+            assert sidecar_path(output).read_bytes() == sidecar_path(expected_path).read_bytes()
+
+
+def _exit_worker(pdf_path, first_page, step, page_queue):
+    os._exit(3)
+
+
+def test_dead_worker_fails_the_pipeline():
+    if skipped():
+        return
+    
+    worker = multiprocessing.Process(target=_exit_worker, args=(None, 1, 1, None))
+    worker.start()
+    worker.join()
+    try:
+        _next_page(multiprocessing.Queue(), worker)
+    except RuntimeError as e:
+        assert "exited with code 3" in str(e)
+    else:
+        raise AssertionError("no error for a worker that exited without sending pages")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = Path(tmp) / "notes.pdf"
+        make_pdf(pdf_path, [TEXT_PAGE, TEXT_PAGE])
+        output = Path(tmp) / "normalized.md"
+        
+        extract_pages = extractor._extract_pages
+        extractor._extract_pages = _exit_worker
+        try:
+            assert not extract_and_normalize(pdf_path, output, workers=2)
+        finally:
+            extractor._extract_pages = extract_pages
+        assert not output.exists()
+
+
+def main():
+    tests = [
+        test_sample_page_indexes,
+        test_image_only_pdf_is_detected,
+        test_full_extracts_past_image_only_samples,
+        test_pipeline_matches_extract_then_normalize,
+        test_dead_worker_fails_the_pipeline,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for generation backends and the response cache.
+
+Runs against the deterministic StubServer, so no model server is needed.
+Run directly or with pytest:
+
+    python tests/test_generation_backends.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+from build_transcript import (  # noqa: E402
+    MAX_SECTIONS,
+    load_style_preset,
+    parse_content,
+    render_transcript,
+)
+from generation_backends import (  # noqa: E402
+    CachedBackend,
+    HttpBackend,
+    ResponseCache,
+    StubServer,
+    stub_response,
+)
+
+
+STYLE = load_style_preset("neutral", SKILL_DIR / "resources")
+CONTENT = parse_content((SKILL_DIR / "examples" / "input_note.md").read_text(encoding="utf-8"))
+
+
+def make_requests(count: int) -> list:
+    return [{"kind": "section", "heading": f"Topic {i}", "content": f"Point {i}."} for i in range(count)]
+
+
+def test_http_backend_batches_in_order():
+    requests = make_requests(7)
+    
+    with StubServer() as server:
+        backend = HttpBackend(server.url, batch_size=2, max_workers=3)
+        texts = backend.generate_batch(requests, STYLE)
+    
+    assert texts == [stub_response(request, STYLE) for request in requests]
+
+
+def test_cached_backend_serves_second_render_from_cache():
+    with StubServer() as server, tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResponseCache(Path(cache_dir))
+        backend = CachedBackend(HttpBackend(server.url), cache)
+        
+        first, _ = render_transcript(CONTENT, 6, STYLE, backend=backend)
+        requests = cache.misses
+        assert cache.hits == 0
+        assert requests == 4 + min(MAX_SECTIONS, len(CONTENT["sections"]))
+        
+        second, _ = render_transcript(CONTENT, 6, STYLE, backend=backend)
+        assert cache.hits == requests
+        assert cache.misses == requests
+    
+    # Only the generation timestamp may differ
+    strip = lambda text: [line for line in text.splitlines() if "**Generated**" not in line]
+    assert strip(first) == strip(second)
+    assert "[neutral hook]" in first
+
+
+def test_cache_evicts_to_max_entries():
+    with StubServer() as server, tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResponseCache(Path(cache_dir), max_entries=3)
+        backend = CachedBackend(HttpBackend(server.url), cache)
+        
+        backend.generate_batch(make_requests(10), STYLE)
+        assert len(list(Path(cache_dir).glob("*.json"))) == 3
+        
+        backend.generate_batch(make_requests(12)[10:], STYLE)
+        assert len(list(Path(cache_dir).glob("*.json"))) == 3
+
+
+def test_cache_is_not_shared_between_servers():
+    with StubServer() as first, StubServer() as second, tempfile.TemporaryDirectory() as cache_dir:
+        cache = ResponseCache(Path(cache_dir))
+        requests = make_requests(3)
+        
+        CachedBackend(HttpBackend(first.url), cache).generate_batch(requests, STYLE)
+        CachedBackend(HttpBackend(second.url), cache).generate_batch(requests, STYLE)
+        assert cache.hits == 0
+        
+        CachedBackend(HttpBackend(first.url + "/"), cache).generate_batch(requests, STYLE)
+        assert cache.hits == 3
+
+
+def main():
+    tests = [
+        test_http_backend_batches_in_order,
+        test_cached_backend_serves_second_render_from_cache,
+        test_cache_evicts_to_max_entries,
+        test_cache_is_not_shared_between_servers,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
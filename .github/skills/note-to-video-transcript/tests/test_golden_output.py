@@ -6,6 +6,8 @@ This script validates that the transcript generation workflow
 produces expected output structure and content coverage.
 """
 
+import hashlib
+import json
 import re
 import sys
 from pathlib import Path
@@ -80,17 +82,50 @@ def validate_coverage(transcript_text: str, input_text: str) -> list:
     return warnings
 
 
-def estimate_duration(transcript_text: str, words_per_minute: int = 150) -> float:
+def load_summary(generated_file: Path, generated_text: str):
+    """
+    Load the summary build_transcript.py writes next to a transcript.
+    
+    Args:
+        generated_file: Generated transcript path
+        generated_text: Its current contents, checked against the
+            summary's hash so a stale summary is not trusted
+    
+    Returns:
+        Summary dict, or None if there is no readable, current summary
+    """
+    summary_file = generated_file.with_suffix(".summary.json")
+    if not summary_file.exists():
+        return None
+    
+    try:
+        summary = json.loads(summary_file.read_text(encoding="utf-8"))
+    except ValueError:
+        return None
+    
+    digest = hashlib.sha256(generated_text.encode("utf-8")).hexdigest()
+    if summary.get("sha256") != digest:
+        print(f"⚠ Ignoring stale summary: {summary_file}")
+        return None
+    return summary
+
+
+def estimate_duration(transcript_text: str, words_per_minute: int = 150, summary: dict = None) -> float:
     """
     Estimate duration from transcript word count.
     
     Args:
         transcript_text: Full transcript
         words_per_minute: Speaking rate (default 150)
+        summary: Optional summary from build_transcript.py; its totals are
+            used directly instead of recounting the transcript
     
     Returns:
         Estimated duration in minutes
     """
+    if summary and "total_seconds" in summary:
+        return summary["total_seconds"] / 60
+    
     # Remove metadata and production notes
     main_content = re.sub(r"^>.*$", "", transcript_text, flags=re.MULTILINE)
     main_content = re.sub(r"\*\*Estimated Duration\*\*:.*$", "", main_content, flags=re.MULTILINE)
@@ -135,6 +170,7 @@ def run_golden_test(input_file: Path, expected_file: Path, generated_file: Path)
     input_text = input_file.read_text(encoding="utf-8")
     expected_text = expected_file.read_text(encoding="utf-8")
     generated_text = generated_file.read_text(encoding="utf-8")
+    summary = load_summary(generated_file, generated_text)
     
     # Run validations
     all_passed = True
@@ -162,11 +198,11 @@ def run_golden_test(input_file: Path, expected_file: Path, generated_file: Path)
     
     print("\n3. Duration Estimation")
     print("-" * 60)
-    duration = estimate_duration(generated_text)
+    duration = estimate_duration(generated_text, summary=summary)
     print(f"Estimated duration: {duration:.1f} minutes")
     
     # Check if within tolerance (±15%)
-    target_duration = 6.0  # Could be extracted from transcript
+    target_duration = summary["target_minutes"] if summary else 6.0
     tolerance = 0.15
     lower_bound = target_duration * (1 - tolerance)
     upper_bound = target_duration * (1 + tolerance)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for the load harness's latency statistics.
+
+Run directly or with pytest:
+
+    python tests/test_load_harness.py
+"""
+
+import sys
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+from load_harness import percentile  # noqa: E402
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    
+    twenty = list(range(1, 21))
+    assert percentile(twenty, 95) == 19
+    assert percentile(twenty, 50) == 10
+    assert percentile(twenty, 96) == 20
+
+
+def test_percentile_edges():
+    assert percentile([], 95) == 0.0
+    assert percentile([7.5], 99) == 7.5
+    assert percentile([3, 1, 2], 0) == 1
+    # Unsorted input
+    assert percentile([0.4, 0.1, 0.3, 0.2], 75) == 0.3
+
+
+def main():
+    tests = [
+        test_percentile_nearest_rank,
+        test_percentile_edges,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the normalizer's metadata sidecar.
+
+build_transcript.py trusts the sidecar in place of a re-parse, so its
+sections must match parse_content() on the normalized text. Run directly
+or with pytest:
+
+    python tests/test_normalize_notes.py
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+from build_transcript import parse_content  # noqa: E402
+from normalize_notes import (  # noqa: E402
+    load_metadata_sidecar,
+    normalize_notes,
+    write_metadata_sidecar,
+)
+
+
+INPUT_TEXT = (SKILL_DIR / "examples" / "input_note.md").read_text(encoding="utf-8")
+
+
+def section_outline(sections: list) -> list:
+    return [(s["heading"], s["path"], s["word_count"]) for s in sections]
+
+
+def assert_sidecar_matches_parse(raw: str):
+    metadata = {}
+    normalized = normalize_notes(raw, metadata)
+    parsed = parse_content(normalized)
+    
+    assert metadata["title"] == parsed["title"]
+    assert section_outline(metadata["sections"]) == section_outline(parsed["sections"])
+
+
+def test_sidecar_matches_parse_on_example():
+    assert_sidecar_matches_parse(INPUT_TEXT)
+
+
+def test_heading_before_title():
+    # The title closes the section before it; text after the title joins
+    # the next section
+    assert_sidecar_matches_parse(
+        "## Preface\n\nWritten on the train.\n\n# Agent Notes\n\nSome framing.\n\n"
+        "## Planning\n\nSplit the task into steps.\n"
+    )
+    
+    metadata = {}
+    normalize_notes("## Preface\n\nOne two.\n\n# Title\n\nThree.\n\n## Body\n\nFour five.\n", metadata)
+    assert [s["heading"] for s in metadata["sections"]] == ["Preface", "Body"]
+    assert metadata["sections"][1]["word_count"] == 3
+
+
+def test_indented_first_heading():
+    # join_normalized() strips the text, turning the first line into a heading
+    assert_sidecar_matches_parse("   # Agent Notes\n\nSome framing.\n\n## Planning\n\nSplit the task.\n")
+    assert_sidecar_matches_parse("\n\n  ## Planning\n\nSplit the task.\n\n## Review\n\nCheck it.\n")
+
+
+def test_stale_sidecar_is_rejected():
+    metadata = {}
+    normalized = normalize_notes(INPUT_TEXT, metadata)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "normalized.md"
+        path.write_text(normalized, encoding="utf-8")
+        write_metadata_sidecar(path, normalized, metadata)
+        
+        assert load_metadata_sidecar(path, normalized)["sections"] == metadata["sections"]
+        assert load_metadata_sidecar(path, normalized + "\nOne more line.\n") is None
+        
+        path.with_suffix(".meta.json").write_text("{not json", encoding="utf-8")
+        assert load_metadata_sidecar(path, normalized) is None
+
+
+def main():
+    tests = [
+        test_sidecar_matches_parse_on_example,
+        test_heading_before_title,
+        test_indented_first_heading,
+        test_stale_sidecar_is_rejected,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Tests for the SQLite notes index.
+
+Each test indexes notes in a temporary directory into a temporary
+database. Run directly or with pytest:
+
+    python tests/test_notes_index.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+from notes_index import (  # noqa: E402
+    connect,
+    has_fts,
+    query_sections,
+    record_transcript,
+    update_index,
+)
+
+
+PLANNING = """# Planning Notes
+
+## Task Splitting
+
+The planner splits each task into ordered steps for the MCP workers.
+
+## Example
+
+```python
+steps = plan(task)
+```
+"""
+
+REVIEW = """# Review Notes
+
+## Checklist
+
+Check every output against the original request.
+"""
+
+
+def write_notes(root: Path) -> dict:
+    notes = {"planning": root / "notes" / "planning.md", "review": root / "days" / "review.md"}
+    notes["planning"].parent.mkdir(parents=True)
+    notes["review"].parent.mkdir(parents=True)
+    notes["planning"].write_text(PLANNING, encoding="utf-8")
+    notes["review"].write_text(REVIEW, encoding="utf-8")
+    return notes
+
+
+def file_row(conn, path: Path):
+    return conn.execute("SELECT * FROM files WHERE path = ?", (str(path.resolve()),)).fetchone()
+
+
+def count(conn, table: str) -> int:
+    return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_update_is_incremental():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        notes = write_notes(root)
+        conn = connect(root / "index.sqlite")
+        roots = [root / "notes", root / "days"]
+        
+        assert update_index(conn, roots) == {"added": 2, "updated": 0, "unchanged": 0, "removed": 0}
+        assert count(conn, "sections") == 3
+        
+        # Same size and mtime: skipped without reading, so the edit is not seen
+        stat = notes["review"].stat()
+        notes["review"].write_text(REVIEW.replace("every", "zebra"), encoding="utf-8")
+        os.utime(notes["review"], ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert update_index(conn, roots)["unchanged"] == 2
+        assert query_sections(conn, mention="zebra") == []
+        
+        # Touched but identical content: only the stored stat changes
+        notes["review"].write_text(REVIEW, encoding="utf-8")
+        os.utime(notes["review"], (stat.st_atime + 60, stat.st_mtime + 60))
+        sha256 = file_row(conn, notes["review"])["sha256"]
+        assert update_index(conn, roots) == {"added": 0, "updated": 0, "unchanged": 2, "removed": 0}
+        assert file_row(conn, notes["review"])["mtime"] == stat.st_mtime + 60
+        assert file_row(conn, notes["review"])["sha256"] == sha256
+        
+        # Changed content: sections are rebuilt
+        notes["review"].write_text(REVIEW + "\n## Follow-up\n\nFile issues for gaps.\n", encoding="utf-8")
+        assert update_index(conn, roots)["updated"] == 1
+        assert [row["heading"] for row in query_sections(conn, mention="gaps")] == ["Follow-up"]
+        assert count(conn, "sections") == 4
+        conn.close()
+
+
+def test_removal_is_limited_to_given_roots():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        notes = write_notes(root)
+        conn = connect(root / "index.sqlite")
+        update_index(conn, [root / "notes", root / "days"])
+        
+        notes["planning"].unlink()
+        notes["review"].unlink()
+        # Only notes/ is refreshed, so the file under days/ stays indexed
+        assert update_index(conn, [root / "notes"])["removed"] == 1
+        assert file_row(conn, notes["planning"]) is None
+        assert file_row(conn, notes["review"]) is not None
+        assert count(conn, "sections") == 1
+        conn.close()
+
+
+def test_transcripts_cascade_on_delete():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        notes = write_notes(root)
+        conn = connect(root / "index.sqlite")
+        update_index(conn, [root / "notes"])
+        
+        transcript = root / "transcript.md"
+        transcript.write_text("# Planning Notes\n\n## Hook\n\nHello.\n", encoding="utf-8")
+        summary = {"preset": "neutral", "target_minutes": 6, "total_words": 1, "total_minutes": 0.1}
+        record_transcript(conn, notes["planning"], transcript, summary)
+        
+        row = conn.execute("SELECT * FROM transcripts").fetchone()
+        assert (row["preset"], row["total_words"]) == ("neutral", 1)
+        assert row["content"].startswith("# Planning Notes")
+        
+        try:
+            record_transcript(conn, notes["review"], transcript)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("recorded a transcript for a note that is not indexed")
+        
+        notes["planning"].unlink()
+        update_index(conn, [root / "notes"])
+        assert count(conn, "transcripts") == 0
+        assert count(conn, "sections") == 0
+        conn.close()
+
+
+def test_fts_and_like_queries_agree():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_notes(root)
+        conn = connect(root / "index.sqlite")
+        update_index(conn, [root / "notes", root / "days"])
+        
+        queries = [
+            {"mention": "MCP"},
+            {"mention": "original request"},
+            {"has_code": True},
+            {"has_code": False, "max_words": 20},
+            {"min_words": 5},
+        ]
+        if has_fts(conn):
+            with_fts = [query_sections(conn, **query) for query in queries]
+            conn.execute("DROP TABLE sections_fts")
+            assert not has_fts(conn)
+            assert [query_sections(conn, **query) for query in queries] == with_fts
+        
+        assert [r["heading"] for r in query_sections(conn, mention="MCP")] == ["Task Splitting"]
+        assert [r["heading"] for r in query_sections(conn, has_code=True)] == ["Example"]
+        assert len(query_sections(conn, has_code=False)) == 2
+        conn.close()
+
+
+def test_cli_query_without_code():
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        write_notes(root)
+        script = str(SKILL_DIR / "scripts" / "notes_index.py")
+        db = str(root / "index.sqlite")
+        
+        subprocess.run(
+            [sys.executable, script, "--db", db, "update", str(root / "notes")],
+            check=True,
+            capture_output=True,
+        )
+        result = subprocess.run(
+            [sys.executable, script, "--db", db, "query", "--no-code", "--json"],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+    
+    assert [row["heading"] for row in json.loads(result.stdout)] == ["Task Splitting"]
+
+
+def main():
+    tests = [
+        test_update_is_incremental,
+        test_removal_is_limited_to_given_roots,
+        test_transcripts_cascade_on_delete,
+        test_fts_and_like_queries_agree,
+        test_cli_query_without_code,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
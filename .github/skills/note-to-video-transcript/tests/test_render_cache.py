@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental rebuilds with the per-document render cache.
+
+Run directly or with pytest:
+
+    python tests/test_render_cache.py
+"""
+
+import sys
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+from build_transcript import (  # noqa: E402
+    MAX_SECTIONS,
+    load_style_preset,
+    parse_content,
+    render_transcript,
+)
+from generation_backends import HttpBackend, StubServer  # noqa: E402
+
+
+STYLE = load_style_preset("neutral", SKILL_DIR / "resources")
+INPUT_TEXT = (SKILL_DIR / "examples" / "input_note.md").read_text(encoding="utf-8")
+
+
+def edit_first_section(text: str) -> str:
+    """Add one sentence to the first section after the title."""
+    lines = text.split("\n")
+    first = next(i for i, line in enumerate(lines) if line.startswith("## "))
+    lines.insert(first + 1, "\nThis extra sentence only changes the first section.")
+    return "\n".join(lines)
+
+
+def rebuild_after_edit(backend=None) -> tuple:
+    render_cache = {}
+    render_transcript(parse_content(INPUT_TEXT), 6, STYLE, backend=backend, render_cache=render_cache)
+    
+    edited = parse_content(edit_first_section(INPUT_TEXT))
+    _, summary = render_transcript(edited, 6, STYLE, backend=backend, render_cache=render_cache)
+    return summary, min(MAX_SECTIONS, len(edited["sections"]))
+
+
+def test_edit_reuses_other_sections():
+    summary, sections = rebuild_after_edit()
+    
+    assert summary["sections_rendered"] == 1
+    assert summary["sections_reused"] == sections - 1
+
+
+def test_unchanged_rebuild_reuses_everything():
+    render_cache = {}
+    content = parse_content(INPUT_TEXT)
+    render_transcript(content, 6, STYLE, render_cache=render_cache)
+    _, summary = render_transcript(content, 6, STYLE, render_cache=render_cache)
+    
+    assert summary["sections_rendered"] == 0
+    assert summary["sections_reused"] == min(MAX_SECTIONS, len(content["sections"]))
+
+
+def test_budget_aware_backend_rerenders_shifted_budgets():
+    # The edit moves every proportional budget, and the HTTP backend is
+    # given the budget, so sections whose budget changed render again
+    with StubServer() as server:
+        summary, sections = rebuild_after_edit(HttpBackend(server.url))
+    
+    assert summary["sections_rendered"] + summary["sections_reused"] == sections
+    assert summary["sections_rendered"] > 1
+
+
+def test_other_server_rerenders_everything():
+    render_cache = {}
+    content = parse_content(INPUT_TEXT)
+    with StubServer() as first, StubServer() as second:
+        render_transcript(content, 6, STYLE, backend=HttpBackend(first.url), render_cache=render_cache)
+        _, summary = render_transcript(content, 6, STYLE, backend=HttpBackend(second.url), render_cache=render_cache)
+    
+    assert summary["sections_reused"] == 0
+
+
+def main():
+    tests = [
+        test_edit_reuses_other_sections,
+        test_unchanged_rebuild_reuses_everything,
+        test_budget_aware_backend_rerenders_shifted_budgets,
+        test_other_server_rerenders_everything,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
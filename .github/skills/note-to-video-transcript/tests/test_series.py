@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for series mode: packing long notes into episodes.
+
+Run directly or with pytest:
+
+    python tests/test_series.py
+"""
+
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+from build_transcript import (  # noqa: E402
+    FIXED_WORDS,
+    MIN_SECTION_WORDS,
+    WORDS_PER_MINUTE,
+    build_series,
+    load_style_preset,
+    parse_content,
+    partition_sections,
+)
+
+
+STYLE = load_style_preset("neutral", SKILL_DIR / "resources")
+MINUTES = 3
+BUDGET = MINUTES * WORDS_PER_MINUTE - FIXED_WORDS
+
+
+def paragraph(words: int) -> str:
+    return " ".join(f"word{i}" for i in range(words)) + "."
+
+
+def long_document() -> dict:
+    """Chapters of varied size: small, oversized, empty and one huge section."""
+    chapters = [
+        ("Setup", [40, 30]),
+        ("Planning", [60, 120, 90, 80]),  # Larger than one episode: split
+        ("Glossary", [0, 0, 5]),  # Floored at MIN_SECTION_WORDS each
+        ("Execution", [50]),
+        ("Deep Dive", [BUDGET + 150]),  # A single section over budget
+        ("Review", [20, 45]),
+        ("Next Steps", [10]),
+    ]
+    lines = ["# Agent Handbook", "", "Framing for the whole series.", ""]
+    for chapter, subsections in chapters:
+        lines += [f"## {chapter}", "", paragraph(25), ""]
+        for i, words in enumerate(subsections, 1):
+            lines += [f"### {chapter} {i}", ""]
+            if words:
+                lines += [paragraph(words), ""]
+    return parse_content("\n".join(lines))
+
+
+def packed_words(part: list) -> int:
+    return sum(max(section["word_count"], MIN_SECTION_WORDS) for section in part)
+
+
+def test_parts_keep_every_section_in_order():
+    sections = long_document()["sections"]
+    parts = partition_sections(sections, MINUTES)
+    
+    assert len(parts) > 2
+    assert all(parts)
+    assert [s["section_id"] for part in parts for s in part] == [s["section_id"] for s in sections]
+
+
+def test_parts_fit_the_episode_budget():
+    parts = partition_sections(long_document()["sections"], MINUTES)
+    
+    for part in parts:
+        # Only a section too long for any episode may overflow, alone
+        assert packed_words(part) <= BUDGET or len(part) == 1
+    assert any(len(part) == 1 and packed_words(part) > BUDGET for part in parts)
+
+
+def test_groups_stay_together_unless_oversized():
+    parts = partition_sections(long_document()["sections"], MINUTES)
+    part_of = {s["section_id"]: i for i, part in enumerate(parts) for s in part}
+    
+    def parts_for(chapter: str) -> set:
+        return {part_of[s["section_id"]] for part in parts for s in part if s["path"][1] == chapter}
+    
+    assert len(parts_for("Setup")) == 1
+    assert len(parts_for("Glossary")) == 1
+    assert len(parts_for("Planning")) > 1
+
+
+def test_empty_sections_are_floored():
+    sections = [{"level": 2, "heading": f"S{i}", "word_count": 0} for i in range(7)]
+    # Room for exactly three floored sections per episode
+    minutes = (3 * MIN_SECTION_WORDS + FIXED_WORDS) / WORDS_PER_MINUTE
+    
+    parts = partition_sections(sections, minutes)
+    assert [len(part) for part in parts] == [3, 3, 1]
+    assert partition_sections([], MINUTES) == []
+
+
+def test_index_links_parts_in_order():
+    content = long_document()
+    parts = partition_sections(content["sections"], MINUTES)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        output_dir = Path(tmp) / "series"
+        paths = build_series(content, MINUTES, STYLE, output_dir, workers=2)
+        index = (output_dir / "index.md").read_text(encoding="utf-8")
+        
+        assert [path.name for path in paths] == [f"part-{i:02d}.md" for i in range(1, len(parts) + 1)]
+        assert all(path.exists() and path.with_suffix(".summary.json").exists() for path in paths)
+        first_part = paths[0].read_text(encoding="utf-8")
+    
+    links = re.findall(r"^## \[Part (\d+): (.+)\]\((part-\d+\.md)\)$", index, re.MULTILINE)
+    assert links == [
+        (str(i), part[0]["heading"], f"part-{i:02d}.md")
+        for i, part in enumerate(parts, 1)
+    ]
+    # The part label is shown in the header, never spoken
+    assert "Part 1 of" in first_part
+    assert "Part 1 of" not in first_part.split("## Hook", 1)[1]
+
+
+def main():
+    tests = [
+        test_parts_keep_every_section_in_order,
+        test_parts_fit_the_episode_budget,
+        test_groups_stay_together_unless_oversized,
+        test_empty_sections_are_floored,
+        test_index_links_parts_in_order,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()
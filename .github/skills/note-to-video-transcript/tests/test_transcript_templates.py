@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for compiled layout and preset phrase templates.
+
+Run directly or with pytest:
+
+    python tests/test_transcript_templates.py
+"""
+
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+SKILL_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+from build_transcript import load_style_preset, parse_content, render_transcript  # noqa: E402
+from transcript_templates import (  # noqa: E402
+    PHRASE_KEYS,
+    compile_template,
+    list_presets,
+    load_layout,
+    load_preset_config,
+)
+
+
+NEUTRAL = SKILL_DIR / "resources" / "style-presets" / "neutral.md"
+CONTENT = parse_content((SKILL_DIR / "examples" / "input_note.md").read_text(encoding="utf-8"))
+
+
+def expect_value_error(function, *args) -> str:
+    try:
+        function(*args)
+    except ValueError as e:
+        return str(e)
+    raise AssertionError(f"{function.__name__} accepted {args}")
+
+
+def copy_resources(tmp: str) -> Path:
+    resources = Path(tmp) / "resources"
+    shutil.copytree(SKILL_DIR / "resources", resources)
+    return resources
+
+
+def test_unknown_fields_are_rejected():
+    render = compile_template("Learn {title:>5}!", "hook", PHRASE_KEYS["hook"])
+    assert render({"title": "MCP"}) == "Learn   MCP!"
+    
+    error = expect_value_error(compile_template, "Learn {topic}!", "neutral:hook", PHRASE_KEYS["hook"])
+    assert "{topic}" in error and "neutral:hook" in error
+    expect_value_error(compile_template, "Thanks, {title}!", "cta", PHRASE_KEYS["cta"])
+    expect_value_error(compile_template, "{title.upper}", "hook")
+    expect_value_error(compile_template, "{title!r}", "hook")
+
+
+def test_every_phrase_field_renders():
+    # Each allowed field is supplied when the phrase is rendered
+    with tempfile.TemporaryDirectory() as tmp:
+        resources = copy_resources(tmp)
+        preset = resources / "style-presets" / "every-field.md"
+        text = NEUTRAL.read_text(encoding="utf-8")
+        for key in ["hook", "intro"]:
+            phrase = load_preset_config(NEUTRAL)["phrases"][key]
+            text = text.replace(phrase, "{title} / {title_lower} / {topics}")
+        preset.write_text(text, encoding="utf-8")
+        
+        style = load_style_preset("every-field", resources)
+        transcript, _ = render_transcript(CONTENT, 6, style)
+    
+    assert style["name"] == "every-field"
+    topics = ", ".join(section["heading"] for section in CONTENT["sections"][:3])
+    assert transcript.count(f"{CONTENT['title']} / {CONTENT['title'].lower()} / {topics}") == 2
+
+
+def test_unknown_field_falls_back_to_neutral():
+    with tempfile.TemporaryDirectory() as tmp:
+        resources = copy_resources(tmp)
+        text = NEUTRAL.read_text(encoding="utf-8")
+        hook = load_preset_config(NEUTRAL)["phrases"]["hook"]
+        (resources / "style-presets" / "teaser.md").write_text(
+            text.replace(hook, "Learn {topic}!"), encoding="utf-8"
+        )
+        
+        error = expect_value_error(load_preset_config, resources / "style-presets" / "teaser.md")
+        assert "{topic}" in error
+        
+        style = load_style_preset("teaser", resources)
+        assert style["name"] == "neutral"
+        assert style["phrases"]["hook"] == hook
+        
+        result = subprocess.run(
+            [
+                sys.executable, str(SKILL_DIR / "scripts" / "transcript_templates.py"),
+                "--resources", str(resources),
+            ],
+            capture_output=True,
+            text=True,
+        )
+    
+    assert result.returncode == 1
+    assert "{topic}" in result.stdout
+
+
+def test_layout_rejects_unknown_fields():
+    with tempfile.TemporaryDirectory() as tmp:
+        layout = Path(tmp) / "transcript-template.md"
+        text = (SKILL_DIR / "resources" / "transcript-template.md").read_text(encoding="utf-8")
+        layout.write_text(text.replace("{preset}", "{preset_name}"), encoding="utf-8")
+        
+        error = expect_value_error(load_layout, layout)
+        assert "{preset_name}" in error and "header" in error
+
+
+def test_shipped_templates_are_valid():
+    load_layout()
+    for name in list_presets():
+        load_preset_config(SKILL_DIR / "resources" / "style-presets" / f"{name}.md")
+
+
+def main():
+    tests = [
+        test_unknown_fields_are_rejected,
+        test_every_phrase_field_renders,
+        test_unknown_field_falls_back_to_neutral,
+        test_layout_rejects_unknown_fields,
+        test_shipped_templates_are_valid,
+    ]
+    for test in tests:
+        test()
+        print(f"✓ {test.__name__}")
+
+
+if __name__ == "__main__":
+    main()